@@ -16,3 +16,5 @@ settings = Dynaconf(
 # user.toml is loaded after settings.toml so user config overrides/extends defaults
 # merge_enabled ensures [core_settings] in user.toml merges with settings.toml
 # Glob pattern "settings/*.toml" auto-discovers new model configs - just add a file!
+# This is the only Dynaconf instance - update it in place with settings.set()
+# rather than constructing another one (which re-parses every file above).
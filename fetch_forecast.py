@@ -7,19 +7,26 @@ command-line interface.
 """
 
 import datetime as dt
+import functools
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import tomli_w
 import typer
-from loguru import logger
 from rich.console import Console
-from rich.logging import RichHandler
-from rich.prompt import Confirm, Prompt
+from rich.prompt import Confirm, FloatPrompt, Prompt
+from rich.table import Table
 from typing_extensions import Annotated
 
-import noaa_grib_fetcher as ngf
-import noaa_query_builder as nqb
-from config import settings
+if TYPE_CHECKING:
+    from dynaconf import Dynaconf  # pyright: ignore[reportMissingTypeStubs]
+
+    import noaa_grib_fetcher as ngf
+    import noaa_query_builder as nqb
+
+# Settings (dynaconf), logging (loguru), the fetcher and the query builder
+# (httpx, pydantic) are imported on first use so `--help` starts fast and
+# commands only load what they need.
 
 app = typer.Typer(
     help="Fetch NOAA weather forecast data",
@@ -27,6 +34,15 @@ app = typer.Typer(
 )
 console = Console()
 
+# Parsed user.toml keyed by its mtime, so repeated saves skip the re-parse
+_user_config_cache: tuple[int, dict[str, Any]] | None = None
+
+# Set once setup_logging() has installed the rich handler
+_logging_configured = False
+
+# Last successfully downloaded run, kept in the storage directory
+_LAST_SUCCESS_FILE = "_last_success.json"
+
 
 # =============================================================================
 # LOGGING SETUP
@@ -37,8 +53,15 @@ def setup_logging() -> None:
     """
     Configure loguru with rich handler for enhanced console output.
 
-    Should be called once at application entry point.
+    Called from each command entry point; repeat calls are no-ops.
     """
+    global _logging_configured
+    if _logging_configured:
+        return
+
+    from loguru import logger
+    from rich.logging import RichHandler
+
     # Remove default handler
     logger.remove()
 
@@ -52,61 +75,132 @@ def setup_logging() -> None:
         format="{message}",
         level="INFO",
     )
+    _logging_configured = True
+
+
+@functools.cache
+def get_settings() -> "Dynaconf":
+    """Import the shared settings object on first use (cached)."""
+    from config import settings
 
+    return settings
 
+
+@functools.lru_cache(maxsize=1)
 def get_storage_path() -> Path | None:
-    """Get configured storage path, or None if not configured."""
+    """
+    Get configured storage path, or None if not configured.
+
+    Cached for the life of the process; cleared when a new path is saved.
+    The DYNACONF_CORE_SETTINGS__OUTPUT_DIR override is checked directly
+    first, skipping the layered settings lookup.
+    """
+    env_path = os.environ.get("DYNACONF_CORE_SETTINGS__OUTPUT_DIR")
+    if env_path:
+        return Path(env_path)
+
+    settings = get_settings()
     try:
         return Path(settings.core_settings.output_dir)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
     except (AttributeError, KeyError):
         return None
 
 
+def load_user_config(user_config_file: Path) -> dict[str, Any]:
+    """
+    Load user.toml, reusing the previous parse if the file is unchanged.
+
+    The cached dict is keyed by the file's mtime, so edits made outside
+    the CLI are still picked up. A missing file yields an empty config.
+    """
+    import tomllib
+
+    try:
+        mtime = user_config_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    if _user_config_cache is not None and _user_config_cache[0] == mtime:
+        return _user_config_cache[1]
+
+    with open(user_config_file, "rb") as f:
+        return tomllib.load(f)
+
+
 def save_storage_path(storage_path: Path) -> None:
     """
     Save storage path to user.toml file.
 
     Separates user configuration (output_dir) from application configuration.
     This avoids polluting version-controlled settings.toml with user paths.
-    """
-    import tomli
 
+    On a fresh install (no user.toml yet) the two-line document is written
+    directly; tomli_w is only loaded when other settings must be preserved
+    or the path needs TOML escaping.
+    """
+    global _user_config_cache
     user_config_file = Path("user.toml")
+    output_dir = str(storage_path)
 
     # Read current user config
-    if user_config_file.exists():
-        with open(user_config_file, "rb") as f:
-            config = tomli.load(f)
-    else:
-        config = {}
+    config = load_user_config(user_config_file)
+    fresh = not config
 
     # Ensure core_settings section exists
     if "core_settings" not in config:
         config["core_settings"] = {}
 
     # Update output_dir
-    config["core_settings"]["output_dir"] = str(storage_path)
+    config["core_settings"]["output_dir"] = output_dir
+
+    if fresh and output_dir.isprintable() and not any(c in output_dir for c in '"\\'):
+        content = f'[core_settings]\noutput_dir = "{output_dir}"\n'.encode()
+    else:
+        import tomli_w
+
+        content = tomli_w.dumps(config).encode()
 
-    # Write to user.toml
-    with open(user_config_file, "wb") as f:
-        tomli_w.dump(config, f)
+    # Write to a temp file and swap it in, so an interrupted write
+    # can never leave a truncated user.toml behind
+    tmp_file = user_config_file.with_suffix(".toml.tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, user_config_file)
+    _user_config_cache = (user_config_file.stat().st_mtime_ns, config)
+    get_storage_path.cache_clear()
 
     console.print(
         f"[green]✓[/green] Storage path configured: [cyan]{storage_path}[/cyan]"
     )
 
 
+def expand_storage_path(path_input: str) -> Path:
+    """
+    Expand a user-entered storage path to an absolute path.
+
+    Only relative paths or paths containing '..' need resolve(); a clean
+    absolute path is returned as-is to skip the per-component realpath walk.
+    """
+    path = Path(path_input).expanduser()
+    if path.is_absolute() and ".." not in path.parts:
+        return path
+    return path.resolve()
+
+
 def ensure_storage_configured() -> Path:
     """
     Ensure storage path is configured. Prompts user if not set.
 
     First-run setup: prompts for storage directory and saves to settings.
-    Must reload settings after saving to pick up the new configuration.
+    The new value is also set on the shared settings object so later lookups
+    (and other modules holding `config.settings`) see it without a reload.
 
     Returns:
         Configured storage path
     """
-    global settings
+    settings = get_settings()
     storage_path = get_storage_path()
 
     if storage_path is None:
@@ -119,7 +213,7 @@ def ensure_storage_configured() -> Path:
             default=str(default_path),  # pyright: ignore[reportUnknownArgumentType]
         )
 
-        storage_path = Path(path_input).expanduser().resolve()
+        storage_path = expand_storage_path(path_input)
 
         # Create directory if it doesn't exist
         if not storage_path.exists():
@@ -134,26 +228,72 @@ def ensure_storage_configured() -> Path:
 
         save_storage_path(storage_path)
 
-        # Reload settings to pick up the new output_dir value from user.toml
-        from dynaconf import Dynaconf  # pyright: ignore[reportMissingTypeStubs]
-
-        settings = Dynaconf(
-            envvar_prefix="DYNACONF",
-            settings_files=[
-                "settings.toml",
-                "user.toml",
-                ".secrets.toml",
-                "settings/*.toml",
-            ],
-            merge_enabled=True,
-        )
+        # Update the live settings in place rather than re-parsing every TOML file
+        settings.set("core_settings.output_dir", str(storage_path))  # pyright: ignore[reportUnknownMemberType]
+        get_core_settings.cache_clear()
 
     return storage_path
 
 
-def get_available_query_presets() -> list[str]:
-    """Get list of available query preset names from GFS settings."""
-    return list(settings.GFS_QUERIES.keys())  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+@functools.lru_cache(maxsize=1)
+def get_available_query_presets() -> tuple[str, ...]:
+    """Get available query preset names from GFS settings (cached)."""
+    settings = get_settings()
+    return tuple(settings.GFS_QUERIES.keys())  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+
+
+@functools.lru_cache(maxsize=1)
+def get_preset_names() -> frozenset[str]:
+    """Get query preset names as a set for O(1) validation (cached)."""
+    return frozenset(get_available_query_presets())
+
+
+def validate_preset(preset: str) -> None:
+    """Raise BadParameter listing valid presets if preset is unknown."""
+    if preset not in get_preset_names():
+        available = ", ".join(get_available_query_presets())
+        raise typer.BadParameter(
+            f"Unknown preset {preset!r}. Available: {available}",
+            param_hint="--preset",
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def get_model_data() -> "nqb.ModelData":
+    """Get validated GFS variables/levels (cached; settings are static at runtime)."""
+    import noaa_query_builder as nqb
+
+    settings = get_settings()
+    return nqb.ModelData.model_validate(settings.GFS_DATA)  # pyright: ignore[reportUnknownMemberType]
+
+
+@functools.lru_cache(maxsize=1)
+def get_core_settings() -> "nqb.CoreSettings":
+    """Get validated core settings (cached; cleared when output_dir is set)."""
+    import noaa_query_builder as nqb
+
+    settings = get_settings()
+    return nqb.CoreSettings.model_validate(settings.core_settings)  # pyright: ignore[reportUnknownMemberType]
+
+
+@functools.lru_cache(maxsize=1)
+def get_query_model() -> "nqb.QueryModel":
+    """Get validated GFS product configuration (cached)."""
+    import noaa_query_builder as nqb
+
+    settings = get_settings()
+    return nqb.QueryModel.model_validate(
+        settings.GFS_PRODUCTS.gfs_quarter_degree,  # pyright: ignore[reportUnknownMemberType]
+    )
+
+
+@functools.cache
+def get_query_mask(preset: str) -> "nqb.QueryMask":
+    """Get validated variable/level masks for a query preset (cached per preset)."""
+    import noaa_query_builder as nqb
+
+    settings = get_settings()
+    return nqb.QueryMask.model_validate(getattr(settings.GFS_QUERIES, preset))  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
 
 
 def prompt_for_query_preset() -> str:
@@ -168,55 +308,50 @@ def prompt_for_query_preset() -> str:
         console.print(f"[dim]Auto-selecting query preset: {presets[0]}[/dim]")
         return presets[0]
 
-    console.print("\n[bold]Available Query Presets:[/bold]")
-    for i, preset in enumerate(presets, 1):
-        console.print(f"  {i}. {preset}")
+    choices = [str(i) for i in range(1, len(presets) + 1)]
+    menu = [f"  {i}. {preset}" for i, preset in zip(choices, presets, strict=True)]
+    console.print("\n[bold]Available Query Presets:[/bold]\n" + "\n".join(menu))
 
-    while True:
-        choice = Prompt.ask(
-            "\nSelect preset",
-            choices=[str(i) for i in range(1, len(presets) + 1)],
-            default="1",
-        )
-        return presets[int(choice) - 1]
+    # Prompt.ask re-prompts until the answer is one of choices
+    choice = Prompt.ask(
+        "\nSelect preset",
+        choices=choices,
+        default="1",
+    )
+    return presets[int(choice) - 1]
 
 
-def prompt_for_location() -> nqb.LocationSettings:
+def prompt_for_location() -> "nqb.LocationSettings":
     """
     Interactively prompt user for location parameters.
 
     Uses center point + expanse format (more intuitive than bounding box).
     Defaults pulled from settings.DEFAULT_LOCATION.
     """
+    import noaa_query_builder as nqb
+
+    settings = get_settings()
     console.print("\n[bold]Location Configuration[/bold]")
     console.print("[dim]Using center point + expanse format[/dim]")
 
     # Get defaults from settings
     defaults = settings.DEFAULT_LOCATION  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
 
-    center_lat = float(
-        Prompt.ask(
-            "Center latitude (-90 to 90)",
-            default=str(defaults.center_lat),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-        )
+    center_lat = FloatPrompt.ask(
+        "Center latitude (-90 to 90)",
+        default=float(defaults.center_lat),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
     )
-    center_lon = float(
-        Prompt.ask(
-            "Center longitude (-180 to 180)",
-            default=str(defaults.center_lon),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-        )
+    center_lon = FloatPrompt.ask(
+        "Center longitude (-180 to 180)",
+        default=float(defaults.center_lon),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
     )
-    height_degrees = float(
-        Prompt.ask(
-            "Height in degrees",
-            default=str(defaults.height_degrees),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-        )
+    height_degrees = FloatPrompt.ask(
+        "Height in degrees",
+        default=float(defaults.height_degrees),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
     )
-    width_degrees = float(
-        Prompt.ask(
-            "Width in degrees",
-            default=str(defaults.width_degrees),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-        )
+    width_degrees = FloatPrompt.ask(
+        "Width in degrees",
+        default=float(defaults.width_degrees),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
     )
 
     return nqb.LocationSettings(
@@ -227,6 +362,7 @@ def prompt_for_location() -> nqb.LocationSettings:
     )
 
 
+@functools.lru_cache(maxsize=128)
 def generate_output_filename(
     model_name: str,
     product_name: str,  # pyright: ignore[reportUnusedParameter]
@@ -254,21 +390,38 @@ def generate_output_filename(
     Returns:
         Path to output file in run-specific subdirectory
     """
-    date_part = forecast_time.strftime("%Y%m%d")
-    hour_part = forecast_time.strftime("%H")
+    run_stamp = forecast_time.strftime("%Y%m%d_%H")
 
     # Create run-specific folder name
-    folder_name = f"{date_part}_{hour_part}_{model_name}_{preset_name}"
+    folder_name = f"{run_stamp}_{model_name}_{preset_name}"
     run_folder = storage_path / folder_name
 
     # Create filename with forecast hour
-    filename = (
-        f"{date_part}_{hour_part}_{forecast_hour:03d}_{model_name}_{preset_name}.grib"
-    )
+    filename = f"{run_stamp}_{forecast_hour:03d}_{model_name}_{preset_name}.grib"
 
     return run_folder / filename
 
 
+def parse_forecast_hours(value: str) -> tuple[int, ...]:
+    """
+    Parse comma-separated forecast hours (e.g., "6,12,24").
+
+    Hour 0 is the analysis file, which is always downloaded, so it is
+    dropped. Duplicates are removed, keeping first-seen order.
+    """
+    try:
+        parsed = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise typer.BadParameter(
+            f"Expected comma-separated integers, got {value!r}", param_hint="--hours"
+        ) from None
+
+    if any(hour < 0 for hour in parsed):
+        raise typer.BadParameter("Forecast hours must be >= 0", param_hint="--hours")
+
+    return tuple(dict.fromkeys(hour for hour in parsed if hour != 0))
+
+
 def create_backup_file(original_path: Path) -> Path:
     """
     Create a backup of an existing file before overwriting.
@@ -287,21 +440,31 @@ def create_backup_file(original_path: Path) -> Path:
     Returns:
         Path to created backup file
     """
-    # Find next available backup number
-    backup_num = 0
-    while backup_num < settings.backup.max_count:  # pyright: ignore[reportUnknownMemberType]
-        backup_path = Path(
-            f"{original_path}.{backup_num:02d}{settings.backup.extension}"  # pyright: ignore[reportUnknownMemberType]
-        )
-        if not backup_path.exists():
-            break
-        backup_num += 1
-    else:
-        # If all backup slots full, overwrite the last one
-        final_backup_num = settings.backup.max_count - 1  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-        backup_path = Path(
-            f"{original_path}.{final_backup_num:02d}{settings.backup.extension}"  # pyright: ignore[reportUnknownMemberType]
-        )
+    settings = get_settings()
+    max_count: int = settings.backup.max_count  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    extension: str = settings.backup.extension  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+    # Collect used backup numbers from one directory listing
+    prefix = f"{original_path.name}."
+    slot_len = len(prefix) + 2 + len(extension)
+    used_nums: set[int] = set()
+    with os.scandir(original_path.parent) as entries:
+        for entry in entries:
+            name = entry.name
+            if (
+                len(name) == slot_len
+                and name.startswith(prefix)
+                and name.endswith(extension)
+            ):
+                digits = name[len(prefix) : len(prefix) + 2]
+                if digits.isdigit():
+                    used_nums.add(int(digits))
+
+    # Find next available backup number; if all slots full, overwrite the last one
+    backup_num = next(
+        (num for num in range(max_count) if num not in used_nums), max_count - 1
+    )
+    backup_path = original_path.with_name(f"{prefix}{backup_num:02d}{extension}")
 
     # Create backup by renaming original
     _ = original_path.rename(backup_path)
@@ -310,6 +473,169 @@ def create_backup_file(original_path: Path) -> Path:
     return backup_path
 
 
+def install_download(staged_path: Path, output_path: Path) -> None:
+    """
+    Move a completed download into place, backing up any existing file first.
+
+    Runs only after the download succeeded, so a failed or interrupted fetch
+    leaves the existing file untouched and uses no backup slot. If the file
+    was staged in another run's folder, that folder is removed when empty.
+    """
+    if output_path.exists():
+        console.print("  [dim]Backing up existing file...[/dim]")
+        _ = create_backup_file(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(staged_path, output_path)
+    if staged_path.parent != output_path.parent:
+        try:
+            staged_path.parent.rmdir()
+        except OSError:
+            pass  # Holds other files
+
+
+def validators_path(output_path: Path) -> Path:
+    """Sidecar holding the ETag/Last-Modified a downloaded file was served with."""
+    return output_path.with_name(f"{output_path.name}.meta.json")
+
+
+def file_sha256(path: Path) -> str:
+    """Hex SHA-256 of a file's contents, read in chunks."""
+    import hashlib
+
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def load_conditional_headers(output_path: Path) -> dict[str, dict[str, str]]:
+    """
+    Conditional-GET headers for the URL output_path was downloaded from.
+
+    Returns {url: headers} from the file's validators sidecar, or {} if there
+    is no usable sidecar, so a rerun within the same cycle can get a 304
+    instead of the whole file again. The local file must still match the
+    size and SHA-256 recorded at download time; a truncated or edited file
+    gets no conditional headers and is downloaded in full.
+    """
+    import json
+
+    try:
+        with open(validators_path(output_path), encoding="utf-8") as f:
+            meta = json.load(f)
+        if output_path.stat().st_size != meta["size"]:
+            return {}
+        if file_sha256(output_path) != meta["sha256"]:
+            return {}
+        headers: dict[str, str] = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return {meta["url"]: headers} if headers else {}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def save_validators(output_path: Path, attempt: "ngf.FetchAttempt") -> None:
+    """
+    Record the validators of the response output_path was just written from,
+    with the file's size and SHA-256 so a later 304 is only trusted for an
+    intact copy.
+
+    A response without ETag or Last-Modified removes any stale sidecar.
+    """
+    import json
+
+    meta_file = validators_path(output_path)
+    if attempt.etag is None and attempt.last_modified is None:
+        meta_file.unlink(missing_ok=True)
+        return
+
+    tmp_file = meta_file.with_name(f"{meta_file.name}.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "url": attempt.url,
+                "etag": attempt.etag,
+                "last_modified": attempt.last_modified,
+                "size": output_path.stat().st_size,
+                "sha256": file_sha256(output_path),
+            },
+            f,
+        )
+    os.replace(tmp_file, meta_file)
+
+
+def load_last_success_run(
+    storage_path: Path,
+    model_name: str,
+    product_name: str,
+    ttl_minutes: float,
+    newest_run: "nqb.QueryTime",
+) -> tuple[str, str] | None:
+    """
+    Read the run (date_utc, cycle_hour_utc) of the last successful download.
+
+    Stored in {storage_path}/_last_success.json. Returns None if the cache is
+    missing, unreadable, for another model/product, or older than ttl_minutes,
+    or if newest_run (this fetch's first candidate) differs from the one the
+    cached run was found under: a newer cycle has come due since, and it
+    must be tried rather than skipped.
+    """
+    import json
+
+    try:
+        with open(storage_path / _LAST_SUCCESS_FILE, encoding="utf-8") as f:
+            cached = json.load(f)
+        cached_at = dt.datetime.fromisoformat(cached["cached_at"])
+        if (cached["model"], cached["product"]) != (model_name, product_name):
+            return None
+        if (cached["newest_date_utc"], cached["newest_cycle_hour_utc"]) != (
+            newest_run.date_utc,
+            newest_run.cycle_hour_utc,
+        ):
+            return None
+        if dt.datetime.now(tz=dt.timezone.utc) - cached_at > dt.timedelta(
+            minutes=ttl_minutes
+        ):
+            return None
+        return cached["date_utc"], cached["cycle_hour_utc"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_last_success_run(
+    storage_path: Path,
+    model_name: str,
+    product_name: str,
+    qt: "nqb.QueryTime",
+    newest_run: "nqb.QueryTime",
+) -> None:
+    """
+    Record the run that just downloaded successfully (atomic replace).
+
+    newest_run is the first candidate of that fetch, so a later fetch can
+    tell whether a newer cycle has come due since.
+    """
+    import json
+
+    cache_file = storage_path / _LAST_SUCCESS_FILE
+    tmp_file = cache_file.with_suffix(".json.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "model": model_name,
+                "product": product_name,
+                "date_utc": qt.date_utc,
+                "cycle_hour_utc": qt.cycle_hour_utc,
+                "newest_date_utc": newest_run.date_utc,
+                "newest_cycle_hour_utc": newest_run.cycle_hour_utc,
+                "cached_at": dt.datetime.now(tz=dt.timezone.utc).isoformat(),
+            },
+            f,
+        )
+    os.replace(tmp_file, cache_file)
+
+
 @app.command()
 def fetch(
     preset: Annotated[
@@ -366,6 +692,20 @@ def fetch(
             help="Check what forecast is available on server without downloading",
         ),
     ] = False,
+    hours: Annotated[
+        str | None,
+        typer.Option(
+            "--hours",
+            help="Comma-separated forecast hours to download after the analysis file (e.g., '6,12,24')",
+        ),
+    ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Ignore the cached last-good run and ETag sidecar: walk all runs and download in full",
+        ),
+    ] = False,
 ) -> None:
     """
     Fetch NOAA GFS weather forecast data.
@@ -388,14 +728,34 @@ def fetch(
 
         # Check what's available without downloading
         python fetch_forecast.py fetch -p sailing_basic --check-only
+
+        # Also download forecast hours 6, 12 and 24 of the confirmed run
+        python fetch_forecast.py fetch -p sailing_basic --hours 6,12,24
+
+        # Bypass the local caches (start from the newest run, no 304 reuse)
+        python fetch_forecast.py fetch -p sailing_basic --force --no-cache
     """
+    import noaa_grib_fetcher as ngf
+    import noaa_query_builder as nqb
+
     setup_logging()
 
     console.print("[bold blue]grib-getter: NOAA Weather Forecast Fetcher[/bold blue]\n")
 
+    forecast_hours = parse_forecast_hours(hours) if hours else ()
+    if preset is not None:
+        validate_preset(preset)
+
     # Ensure storage path is configured (first-run setup if needed)
     storage_path = ensure_storage_configured()
 
+    # Resolve settings once; dynaconf attribute access is not free
+    settings = get_settings()
+    model_name: str = settings.defaults.model_name  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    product_name: str = settings.defaults.product_name  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    var_prefix: str = settings.query.var_prefix  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    lev_prefix: str = settings.query.lev_prefix  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
     # Determine if we need interactive prompts
     need_preset = preset is None
     need_location = any(x is None for x in [lat, lon, height, width])
@@ -423,84 +783,112 @@ def fetch(
             width_degrees=width,  # pyright: ignore[reportArgumentType]
         )
 
-    # Display configuration summary
-    console.print("\n[bold]Configuration:[/bold]")
-    console.print(
-        f"  Model: [green]{settings.defaults.model_name}[/green] (auto-selected)"  # pyright: ignore[reportUnknownMemberType]
-    )
-    console.print(
-        f"  Product: [green]{settings.defaults.product_name}[/green] (auto-selected)"  # pyright: ignore[reportUnknownMemberType]
-    )
-    console.print(f"  Preset: [green]{preset}[/green]")
-    console.print(
-        f"  Location: [green]{location.center_lat}, {location.center_lon}[/green] "  # pyright: ignore[reportImplicitStringConcatenation]
-        f"({location.width_degrees}° × {location.height_degrees}°)"
-    )
-
     # Load model data and query mask from configuration
-    model_data = nqb.ModelData.model_validate(settings.GFS_DATA)  # pyright: ignore[reportUnknownMemberType]
-    query_mask = nqb.QueryMask.model_validate(getattr(settings.GFS_QUERIES, preset))  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+    model_data = get_model_data()
+    query_mask = get_query_mask(preset)  # pyright: ignore[reportArgumentType]
 
     # Build query structure for NOAA API
     qs = nqb.QueryStructure(
         bounding_box=nqb.create_bounding_box(ls=location),
-        query_model=nqb.QueryModel.model_validate(
-            settings.GFS_PRODUCTS.gfs_quarter_degree,  # pyright: ignore[reportUnknownMemberType]
-        ),
+        query_model=get_query_model(),
         variables=nqb.SelectedKeys(
             all_keys=model_data.variables,
             hex_mask=query_mask.variables,
-            prefix=settings.query.var_prefix,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            prefix=var_prefix,
         ),
         levels=nqb.SelectedKeys(
             all_keys=model_data.levels,
             hex_mask=query_mask.levels,
-            prefix=settings.query.lev_prefix,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            prefix=lev_prefix,
         ),
         current_time=dt.datetime.now(tz=dt.timezone.utc),
-        settings=nqb.CoreSettings.model_validate(settings.core_settings),  # pyright: ignore[reportUnknownMemberType]
+        settings=get_core_settings(),
     )
 
     # Generate query URLs (tries most recent to older forecasts)
-    query_urls = nqb.generate_query_urls(
-        qt_batch=nqb.generate_qt_batch(reference_time=qs.current_time, qs=qs),
-        qs=qs,
+    qt_batch = nqb.generate_qt_batch(reference_time=qs.current_time, qs=qs)
+    newest_run = qt_batch[0]
+
+    # A recent success tells us which run is live - start there instead of
+    # spending a rate-limit wait on each newer run that will 404. Only while
+    # the newest candidate is unchanged: once a newer cycle comes due it is
+    # tried again.
+    last_run = (
+        None
+        if no_cache
+        else load_last_success_run(
+            storage_path,
+            model_name,
+            product_name,
+            settings.noaa_settings.last_success_ttl_minutes,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            newest_run,
+        )
     )
+    if last_run is not None:
+        last_qt = nqb.QueryTime(date_utc=last_run[0], cycle_hour_utc=last_run[1])
+        if last_qt in qt_batch:
+            qt_batch = qt_batch[qt_batch.index(last_qt) :]
+
+    # Built once: the fetch walks them, then the winner is looked up by index
+    query_urls = nqb.build_query_urls(qt_batch=qt_batch, qs=qs)
 
-    # Generate output path in run-specific folder
-    latest_forecast = nqb.get_latest_run_start(dt.datetime.now(tz=dt.timezone.utc), qs)
+    # Generate output path in run-specific folder, named after the first run
+    # the fetch will try; a fallback to an older run is renamed afterwards
+    latest_forecast = nqb.qt_to_datetime(qt_batch[0])
     output_path = generate_output_filename(
-        model_name=settings.defaults.model_name,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-        product_name=settings.defaults.product_name,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+        model_name=model_name,
+        product_name=product_name,
         preset_name=preset,
         forecast_time=latest_forecast,
         forecast_hour=0,  # Analysis file is hour 000
         storage_path=storage_path,
     )
 
-    console.print("\n[bold]Target file:[/bold]")
-    console.print(f"  Path: [cyan]{output_path}[/cyan]")
-    console.print(
-        f"  Forecast time: [cyan]{latest_forecast.strftime('%Y-%m-%d %H:00 UTC')}[/cyan]"
-    )
-
-    # Check if file already exists locally
-    file_exists = output_path.exists()
-    if file_exists:
+    # Check if file already exists locally (one stat call gives existence and size)
+    try:
         file_size = output_path.stat().st_size
-        console.print(
-            f"  Status: [yellow]File already exists ({file_size:,} bytes)[/yellow]"
-        )
-    else:
-        console.print("  Status: [dim]File does not exist locally[/dim]")
+        file_exists = True
+        status = f"[yellow]File already exists ({file_size:,} bytes)[/yellow]"
+    except FileNotFoundError:
+        file_exists = False
+        status = "[dim]File does not exist locally[/dim]"
+
+    # Display configuration summary as one table (single render and write)
+    summary = Table(
+        title="Configuration",
+        title_style="bold",
+        title_justify="left",
+        show_header=False,
+        box=None,
+    )
+    summary.add_column(style="bold")
+    summary.add_column(overflow="fold")
+    summary.add_row("Model", f"[green]{model_name}[/green] (auto-selected)")
+    summary.add_row("Product", f"[green]{product_name}[/green] (auto-selected)")
+    summary.add_row("Preset", f"[green]{preset}[/green]")
+    summary.add_row(
+        "Location",
+        f"[green]{location.center_lat}, {location.center_lon}[/green] "  # pyright: ignore[reportImplicitStringConcatenation]
+        f"({location.width_degrees}° × {location.height_degrees}°)",
+    )
+    summary.add_row("Target file", f"[cyan]{output_path}[/cyan]")
+    summary.add_row(
+        "Forecast time",
+        f"[cyan]{latest_forecast.strftime('%Y-%m-%d %H:00 UTC')}[/cyan]",
+    )
+    summary.add_row("Status", status)
+    console.print()
+    console.print(summary)
 
     # Handle check-only mode (no download, just report)
     if check_only:
-        console.print("\n[bold]Check-only mode:[/bold] No download will be performed")
         if file_exists:
-            console.print("[green]✓[/green] Latest forecast file exists locally")
+            found = "[green]✓[/green] Latest forecast file exists locally"
         else:
-            console.print("[yellow]![/yellow] Latest forecast file not found locally")
+            found = "[yellow]![/yellow] Latest forecast file not found locally"
+        console.print(
+            f"\n[bold]Check-only mode:[/bold] No download will be performed\n{found}"
+        )
         raise typer.Exit(code=0)
 
     # Handle existing file (bandwidth optimization)
@@ -528,30 +916,111 @@ def fetch(
                 raise typer.Exit(code=1)
             # choice == "download" falls through
 
-    # Create backup before overwriting (data integrity protection)
-    if file_exists:
-        console.print("\n[bold]Backing up existing file...[/bold]")
-        _ = create_backup_file(output_path)
-
     console.print("\n[bold]Fetching data...[/bold]")
 
-    # Fetch data
+    # Fetch data to a staging path (written in place, no second staging
+    # step); the existing file is only backed up and replaced once the new
+    # one is complete (data integrity protection).
+    # --force means "download again", so it never asks for a 304.
+    staged_path = ngf.part_path_for(output_path)
     result = ngf.fetch_with_timeout(
         query_urls=query_urls,
-        output_path=output_path,
+        output_path=staged_path,
+        conditional_headers=load_conditional_headers(output_path)
+        if file_exists and not (force or no_cache)
+        else None,
+        stage=False,
     )
 
     # Report results
-    if result.success and result.data:
+    if not (result.success and (result.not_modified or result.bytes_written)):
         console.print(
-            f"\n[bold green]✓ Success![/bold green] "  # pyright: ignore[reportImplicitStringConcatenation]
-            f"Downloaded {len(result.data):,} bytes in {result.total_duration_seconds:.1f}s"
+            f"\n[bold red]✗ Failed[/bold red] after {len(result.attempts)} attempts "  # pyright: ignore[reportImplicitStringConcatenation]
+            f"in {result.total_duration_seconds:.1f}s"
+        )
+        # Don't let a stale run steer the next attempt
+        (storage_path / _LAST_SUCCESS_FILE).unlink(missing_ok=True)
+        raise typer.Exit(code=1)
+
+    # The last attempt's URL identifies the run that was actually downloaded;
+    # its files (analysis and forecast hours) all go in that run's folder
+    confirmed_run = qt_batch[query_urls.index(result.attempts[-1].url)]
+    confirmed_time = nqb.qt_to_datetime(confirmed_run)
+
+    if result.not_modified:
+        console.print(
+            "\n[bold green]✓ Up to date![/bold green] "  # pyright: ignore[reportImplicitStringConcatenation]
+            "Server copy unchanged, keeping existing file\n"
+            f"  File: [cyan]{output_path}[/cyan]"
         )
-        console.print(f"  File: [cyan]{output_path}[/cyan]")
     else:
+        analysis_path = generate_output_filename(
+            model_name=model_name,
+            product_name=product_name,
+            preset_name=preset,
+            forecast_time=confirmed_time,
+            forecast_hour=0,
+            storage_path=storage_path,
+        )
+        install_download(staged_path, analysis_path)
+        save_validators(analysis_path, result.attempts[-1])
         console.print(
-            f"\n[bold red]✗ Failed[/bold red] after {len(result.attempts)} attempts "  # pyright: ignore[reportImplicitStringConcatenation]
-            f"in {result.total_duration_seconds:.1f}s"
+            f"\n[bold green]✓ Success![/bold green] "  # pyright: ignore[reportImplicitStringConcatenation]
+            f"Downloaded {result.bytes_written:,} bytes in {result.total_duration_seconds:.1f}s\n"
+            f"  File: [cyan]{analysis_path}[/cyan]"
+        )
+
+    save_last_success_run(
+        storage_path, model_name, product_name, confirmed_run, newest_run
+    )
+
+    if not forecast_hours:
+        return
+
+    # Analysis file confirmed the run - batch download forecast hours from it
+    hour_urls = nqb.generate_forecast_hour_urls(
+        qt=confirmed_run, forecast_hours=forecast_hours, qs=qs
+    )
+
+    downloads: dict[str, Path] = {}
+    for hour, url in hour_urls.items():
+        hour_path = generate_output_filename(
+            model_name=model_name,
+            product_name=product_name,
+            preset_name=preset,
+            forecast_time=confirmed_time,
+            forecast_hour=hour,
+            storage_path=storage_path,
+        )
+        downloads[url] = hour_path
+
+    console.print(f"\n[bold]Fetching {len(downloads)} forecast hours...[/bold]")
+    batch_results = ngf.fetch_batch(
+        {url: ngf.part_path_for(path) for url, path in downloads.items()},
+        stage=False,
+    )
+
+    # Collect per-hour lines and report them in one write
+    failed_hours = 0
+    report: list[str] = []
+    for hour, hour_path, hour_result in zip(
+        hour_urls, downloads.values(), batch_results, strict=True
+    ):
+        if hour_result.success and hour_result.bytes_written:
+            install_download(ngf.part_path_for(hour_path), hour_path)
+            report.append(
+                f"  [green]✓[/green] f{hour:03d}: {hour_result.bytes_written:,} bytes"
+            )
+        else:
+            failed_hours += 1
+            report.append(
+                f"  [red]✗[/red] f{hour:03d}: failed after {len(hour_result.attempts)} attempts"
+            )
+    console.print("\n".join(report))
+
+    if failed_hours:
+        console.print(
+            f"\n[bold red]{failed_hours} of {len(downloads)} forecast hours failed[/bold red]"
         )
         raise typer.Exit(code=1)
 
@@ -559,9 +1028,8 @@ def fetch(
 @app.command()
 def list_presets() -> None:
     """List available query presets."""
-    console.print("[bold]Available Query Presets:[/bold]\n")
-    for preset in get_available_query_presets():
-        console.print(f"  • {preset}")
+    lines = [f"  • {preset}" for preset in get_available_query_presets()]
+    console.print("[bold]Available Query Presets:[/bold]\n\n" + "\n".join(lines))
 
 
 @app.command()
@@ -594,6 +1062,7 @@ def configure(
 
     if storage_path is None:
         # Interactive mode
+        settings = get_settings()
         current_path = get_storage_path()
         if current_path:
             console.print(f"Current storage path: [cyan]{current_path}[/cyan]\n")
@@ -606,7 +1075,7 @@ def configure(
         storage_path = path_input
 
     # Convert to Path and expand/resolve
-    new_path = Path(storage_path).expanduser().resolve()
+    new_path = expand_storage_path(storage_path)
 
     # Create directory if it doesn't exist
     if not new_path.exists():
@@ -10,17 +10,48 @@ Key features:
 - Comprehensive attempt tracking for debugging
 """
 
+import asyncio
+import atexit
+import os
+import random
+import socket
+import threading
 import time
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import urlsplit
 
 import httpx
 from loguru import logger
-from pydantic import BaseModel
 
 from config import settings
 
+# =============================================================================
+# SETTINGS SNAPSHOT
+# =============================================================================
+
+# Settings are static for the life of the process; read them once here so
+# the retry and download loops don't walk Dynaconf's resolver on every call.
+_HTTP_SUCCESS = int(settings.http_settings.success)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_HTTP_NOT_MODIFIED = int(settings.http_settings.not_modified)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_HTTP_NOT_FOUND = int(settings.http_settings.not_found)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_HTTP_SERVER_ERROR = int(settings.http_settings.server_error)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_REQUEST_TIMEOUT_SECONDS = float(settings.http_settings.request_timeout_seconds)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_DOWNLOAD_CHUNK_BYTES = int(settings.http_settings.download_chunk_bytes)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_KEEPALIVE_EXPIRY_SECONDS = float(settings.http_settings.keepalive_expiry_seconds)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_DNS_CACHE_SECONDS = float(settings.http_settings.dns_cache_seconds)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_RATE_LIMIT_SECONDS = float(settings.noaa_settings.rate_limit_seconds)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_MAX_CONCURRENT_DOWNLOADS = int(settings.noaa_settings.max_concurrent_downloads)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_PROBE_BEFORE_FETCH = bool(settings.noaa_settings.probe_before_fetch)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_INITIAL_DELAY_SECONDS = float(settings.retry_settings.initial_delay_seconds)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_MAX_DELAY_SECONDS = float(settings.retry_settings.max_delay_seconds)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_MAX_ATTEMPTS = int(settings.retry_settings.max_attempts)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_TIMEOUT_MINUTES = float(settings.retry_settings.timeout_minutes)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+_NETWORK_FAILURE_LIMIT = int(settings.retry_settings.network_failure_limit)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+
 # =============================================================================
 # EXCEPTIONS
 # =============================================================================
@@ -29,45 +60,53 @@ from config import settings
 class ForecastDataUnavailable(Exception):
     """Raised when no forecast data is available after all retries."""
 
-    pass
-
 
 class NOAAServerError(Exception):
     """Raised when NOAA server returns 5xx error."""
 
-    pass
-
 
 # =============================================================================
 # DATA STRUCTURES
 # =============================================================================
 
 
-class FetchAttempt(BaseModel):
+@dataclass(slots=True)
+class FetchAttempt:
     """
     Record of a single fetch attempt.
 
-    Tracks URL, status code, error type, and timestamp for debugging.
+    Tracks URL, status code, error type, and timestamp for debugging, plus
+    the response's ETag and Last-Modified validators when it sent them.
+    A plain slotted dataclass: one is built per request, and its fields are
+    only ever set by this module, so validation would be pure overhead.
     """
 
     url: str
     status_code: int | None
     error_type: str | None
     timestamp: datetime
+    etag: str | None = None
+    last_modified: str | None = None
 
 
-class FetchResult(BaseModel):
+@dataclass(slots=True)
+class FetchResult:
     """
     Result of fetch operation with metadata.
 
-    Includes data bytes (if successful), all attempt records, success flag,
-    and total duration for performance tracking.
+    Includes bytes written to disk (if successful), all attempt records,
+    success flag, and total duration for performance tracking. The payload
+    itself is streamed to the output file and never held in memory.
+
+    not_modified is set when a conditional request got 304: the fetch
+    succeeded, but nothing was written because the caller's copy is current.
     """
 
-    data: bytes | None
+    bytes_written: int | None
     attempts: list[FetchAttempt]
     success: bool
     total_duration_seconds: float
+    not_modified: bool = False
 
 
 # =============================================================================
@@ -86,20 +125,21 @@ def calculate_exponential_backoff(
     Prevents thundering herd by adding randomness to retry timing.
     Jitter helps avoid synchronized retries from multiple clients.
     """
-    import random
-
     if initial_delay is None:
-        initial_delay = settings.retry_settings.initial_delay_seconds  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        initial_delay = _INITIAL_DELAY_SECONDS
     if max_delay is None:
-        max_delay = settings.retry_settings.max_delay_seconds  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        max_delay = _MAX_DELAY_SECONDS
 
-    # Exponential backoff: 2^attempt * initial_delay, capped at max_delay
-    delay = min(initial_delay * (2**attempt), max_delay)  # pyright: ignore[reportArgumentType, reportUnknownArgumentType, reportUnknownVariableType]
+    # Exponential backoff: 2^attempt * initial_delay, capped at max_delay.
+    # Past 2^32 the cap has long since applied (and a huge shift would not
+    # convert to float), so skip the arithmetic.
+    if attempt < 32:
+        delay = min(initial_delay * (1 << attempt), max_delay)
+    else:
+        delay = max_delay
 
     # Add jitter: ±20% of calculated delay to prevent thundering herd
-    jitter_percent = 0.2
-    jitter = delay * jitter_percent * (2 * random.random() - 1)  # pyright: ignore[reportUnknownVariableType]
-    return delay + jitter  # pyright: ignore[reportUnknownVariableType]
+    return delay * random.uniform(0.8, 1.2)
 
 
 def should_retry_status_code(status_code: int) -> bool:
@@ -114,10 +154,10 @@ def should_retry_status_code(status_code: int) -> bool:
 
     Returns True if we should retry the same URL with backoff.
     """
-    if status_code == settings.http_settings.not_found:  # pyright: ignore[reportUnknownMemberType]
+    if status_code == _HTTP_NOT_FOUND:
         return False  # Move to next (older) forecast instead of retrying
 
-    return status_code >= settings.http_settings.server_error  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    return status_code >= _HTTP_SERVER_ERROR
 
 
 # =============================================================================
@@ -125,14 +165,120 @@ def should_retry_status_code(status_code: int) -> bool:
 # =============================================================================
 
 
+def part_path_for(output_path: Path) -> Path:
+    """Temporary path a download is streamed to before it replaces output_path."""
+    return output_path.with_name(f"{output_path.name}.part")
+
+
+def stream_to_file(
+    response: httpx.Response,
+    output_path: Path,
+    deadline: float | None = None,
+    stage: bool = True,
+) -> int:
+    """
+    Write a streaming response body to output_path chunk by chunk.
+
+    With stage, the body goes to a .part file that only replaces output_path
+    once complete, so an interrupted download never leaves a truncated file
+    behind. stage=False writes straight to output_path for callers that
+    stage and install the file themselves. Either way a failed download is
+    deleted, and one still streaming when the time.monotonic() deadline
+    passes is abandoned with TimeoutError.
+
+    Returns the number of bytes written.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = part_path_for(output_path) if stage else output_path
+    bytes_written = 0
+    try:
+        with open(part_path, "wb") as f:
+            for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_BYTES):
+                bytes_written += f.write(chunk)
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Fetch deadline passed after {bytes_written:,} bytes"
+                    )
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    if stage:
+        os.replace(part_path, output_path)
+    return bytes_written
+
+
+def check_response_status(status_code: int, attempt: FetchAttempt) -> bool:
+    """
+    Record status code on the attempt and log non-success outcomes.
+
+    Returns True if the response body should be saved.
+    """
+    attempt.status_code = status_code
+
+    if status_code == _HTTP_SUCCESS:
+        return True
+
+    elif status_code == _HTTP_NOT_MODIFIED:
+        logger.info("Not modified (304) - existing file is current")
+
+    elif status_code == _HTTP_NOT_FOUND:
+        logger.warning("Data not found (404) - forecast likely not available yet")
+
+    elif status_code >= _HTTP_SERVER_ERROR:
+        logger.error(f"Server error ({status_code})")
+        attempt.error_type = "server_error"
+
+    else:
+        logger.warning(f"Unexpected status code: {status_code}")
+        attempt.error_type = "client_error"
+
+    return False
+
+
+def record_request_error(error: Exception, attempt: FetchAttempt) -> None:
+    """Log a failed request and classify it on the attempt record."""
+    if isinstance(error, httpx.TimeoutException):
+        logger.error(f"Request timeout after {_REQUEST_TIMEOUT_SECONDS}s")
+        attempt.error_type = "timeout"
+
+    elif isinstance(error, TimeoutError):
+        logger.error(str(error))
+        attempt.error_type = "deadline"
+
+    elif isinstance(error, httpx.NetworkError):
+        logger.error(f"Network error: {error}")
+        attempt.error_type = "network_error"
+
+    else:
+        logger.error(f"Unexpected error: {type(error).__name__}: {error}")
+        attempt.error_type = "unknown_error"
+
+
 def fetch_with_retry(
+    client: httpx.Client,
     url: str,
+    output_path: Path,
     attempt_number: int = 0,
-) -> tuple[httpx.Response | None, FetchAttempt]:
+    headers: dict[str, str] | None = None,
+    deadline: float | None = None,
+    stage: bool = True,
+) -> tuple[int | None, FetchAttempt]:
     """
-    Fetch URL with error handling and logging.
+    Fetch URL with error handling and logging, streaming the body to disk.
+
+    Uses the caller's client so retries and fallback URLs reuse its pooled
+    connection instead of a new DNS lookup and TLS handshake each time.
+
+    On success the response body is written to output_path in chunks of
+    http_settings.download_chunk_bytes, so peak memory is one chunk
+    regardless of GRIB size (staged via a .part file unless stage=False).
+
+    headers are sent with the request (e.g. If-None-Match for a conditional
+    GET); a 304 reply is recorded on the attempt and returns None. A body
+    still streaming when the deadline passes is abandoned (error_type
+    "deadline").
 
-    Returns response and attempt record. Response is None on failure.
+    Returns bytes written and attempt record. Bytes written is None on failure.
     """
     attempt = FetchAttempt(
         url=url,
@@ -144,71 +290,63 @@ def fetch_with_retry(
     try:
         logger.info(f"Fetching (attempt {attempt_number + 1}): {url}")
 
-        response = httpx.get(
-            url,
-            timeout=settings.http_settings.request_timeout_seconds,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-            follow_redirects=True,
-        )
-
-        attempt.status_code = response.status_code
-
-        if response.status_code == settings.http_settings.success:  # pyright: ignore[reportUnknownMemberType]
-            logger.info(f"Success: {len(response.content):,} bytes received")
-            return response, attempt
-
-        elif response.status_code == settings.http_settings.not_found:  # pyright: ignore[reportUnknownMemberType]
-            logger.warning("Data not found (404) - forecast likely not available yet")
-            return None, attempt
-
-        elif response.status_code >= settings.http_settings.server_error:  # pyright: ignore[reportUnknownMemberType]
-            logger.error(f"Server error ({response.status_code})")
-            attempt.error_type = "server_error"
-            return None, attempt
+        with client.stream("GET", url, headers=headers) as response:
+            if check_response_status(response.status_code, attempt):
+                attempt.etag = response.headers.get("ETag")
+                attempt.last_modified = response.headers.get("Last-Modified")
+                bytes_written = stream_to_file(response, output_path, deadline, stage)
+                logger.info(f"Success: {bytes_written:,} bytes received")
+                return bytes_written, attempt
 
-        else:
-            logger.warning(f"Unexpected status code: {response.status_code}")
-            attempt.error_type = "client_error"
-            return None, attempt
+    except (httpx.HTTPError, OSError) as e:
+        record_request_error(e, attempt)
 
-    except httpx.TimeoutException:
-        logger.error(
-            f"Request timeout after {settings.http_settings.request_timeout_seconds}s"  # pyright: ignore[reportUnknownMemberType]
-        )
-        attempt.error_type = "timeout"
-        return None, attempt
-
-    except httpx.NetworkError as e:
-        logger.error(f"Network error: {e}")
-        attempt.error_type = "network_error"
-        return None, attempt
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {type(e).__name__}: {e}")
-        attempt.error_type = "unknown_error"
-        return None, attempt
+    return None, attempt
 
 
 def fetch_with_exponential_backoff(
+    client: httpx.Client,
     url: str,
+    output_path: Path,
     max_attempts: int | None = None,
-) -> tuple[httpx.Response | None, list[FetchAttempt]]:
+    deadline: float | None = None,
+    headers: dict[str, str] | None = None,
+    breaker: "HostCircuitBreaker | None" = None,
+    stage: bool = True,
+) -> tuple[int | None, list[FetchAttempt]]:
     """
     Fetch URL with exponential backoff retry logic.
 
     Only retries on transient errors (5xx, timeout, network).
     Does not retry on 404 or other client errors.
+
+    deadline is a time.monotonic() value: a download still streaming when it
+    passes is abandoned, and no retry is scheduled whose backoff sleep would
+    end after it. With a breaker, retries stop as soon as it opens for the
+    URL's host.
     """
     if max_attempts is None:
-        max_attempts = settings.retry_settings.max_attempts  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        max_attempts = _MAX_ATTEMPTS
 
     attempts: list[FetchAttempt] = []
 
-    for attempt_num in range(max_attempts):  # pyright: ignore[reportArgumentType]
-        response, attempt = fetch_with_retry(url, attempt_num)
+    for attempt_num in range(max_attempts):
+        bytes_written, attempt = fetch_with_retry(
+            client, url, output_path, attempt_num, headers, deadline, stage
+        )
         attempts.append(attempt)
 
-        if response is not None:
-            return response, attempts
+        if bytes_written is not None:
+            return bytes_written, attempts
+
+        if breaker is not None:
+            breaker.record(attempt)
+            if breaker.is_open(url):
+                logger.warning("Repeated network errors, giving up on this host")
+                break
+
+        if attempt.error_type == "deadline":
+            break
 
         # Check if we should retry
         if attempt.status_code and not should_retry_status_code(attempt.status_code):
@@ -216,22 +354,356 @@ def fetch_with_exponential_backoff(
             break
 
         # Don't sleep after last attempt
-        if attempt_num < max_attempts - 1:  # pyright: ignore[reportOptionalOperand]
+        if attempt_num < max_attempts - 1:
             delay = calculate_exponential_backoff(attempt_num)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= delay:
+                    logger.debug("Deadline reached before next retry")
+                    break
             logger.info(f"Retrying in {delay:.1f} seconds...")
             time.sleep(delay)
 
     return None, attempts
 
 
+async def stream_to_file_async(
+    response: httpx.Response, output_path: Path, stage: bool = True
+) -> int:
+    """
+    Async counterpart of stream_to_file for AsyncClient responses.
+
+    File operations run in worker threads so disk I/O never blocks the
+    event loop.
+
+    Returns the number of bytes written.
+    """
+    await asyncio.to_thread(output_path.parent.mkdir, parents=True, exist_ok=True)
+    part_path = part_path_for(output_path) if stage else output_path
+    bytes_written = 0
+    try:
+        f = await asyncio.to_thread(open, part_path, "wb")
+        try:
+            async for chunk in response.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_BYTES):
+                bytes_written += await asyncio.to_thread(f.write, chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    if stage:
+        await asyncio.to_thread(os.replace, part_path, output_path)
+    return bytes_written
+
+
+async def fetch_with_retry_async(
+    client: httpx.AsyncClient,
+    url: str,
+    output_path: Path,
+    attempt_number: int = 0,
+    stage: bool = True,
+) -> tuple[int | None, FetchAttempt]:
+    """
+    Async counterpart of fetch_with_retry using a shared AsyncClient.
+
+    Returns bytes written and attempt record. Bytes written is None on failure.
+    """
+    attempt = FetchAttempt(
+        url=url,
+        status_code=None,
+        error_type=None,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+    try:
+        logger.info(f"Fetching (attempt {attempt_number + 1}): {url}")
+
+        async with client.stream("GET", url) as response:
+            if check_response_status(response.status_code, attempt):
+                bytes_written = await stream_to_file_async(response, output_path, stage)
+                logger.info(f"Success: {bytes_written:,} bytes received")
+                return bytes_written, attempt
+
+    except (httpx.HTTPError, OSError) as e:
+        record_request_error(e, attempt)
+
+    return None, attempt
+
+
+async def fetch_with_exponential_backoff_async(
+    client: httpx.AsyncClient,
+    url: str,
+    output_path: Path,
+    max_attempts: int | None = None,
+    stage: bool = True,
+) -> tuple[int | None, list[FetchAttempt]]:
+    """
+    Async counterpart of fetch_with_exponential_backoff.
+
+    Same retry decisions; backoff waits with asyncio.sleep so other
+    downloads in the batch keep running.
+    """
+    if max_attempts is None:
+        max_attempts = _MAX_ATTEMPTS
+
+    attempts: list[FetchAttempt] = []
+
+    for attempt_num in range(max_attempts):
+        bytes_written, attempt = await fetch_with_retry_async(
+            client, url, output_path, attempt_num, stage
+        )
+        attempts.append(attempt)
+
+        if bytes_written is not None:
+            return bytes_written, attempts
+
+        if attempt.status_code and not should_retry_status_code(attempt.status_code):
+            logger.debug("Status code does not warrant retry")
+            break
+
+        if attempt_num < max_attempts - 1:
+            delay = calculate_exponential_backoff(attempt_num)
+            logger.info(f"Retrying in {delay:.1f} seconds...")
+            await asyncio.sleep(delay)
+
+    return None, attempts
+
+
+# =============================================================================
+# HTTP CLIENT
+# =============================================================================
+
+# Created on first use by get_http_client() and closed at interpreter exit
+_http_client: httpx.Client | None = None
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get the process-wide pooled httpx.Client, creating it on first use.
+
+    Every request to NOMADS goes to the same host, so keeping one client
+    alive lets retries, fallback URLs and later fetches in the same process
+    reuse an open keep-alive connection instead of a new DNS lookup and TLS
+    handshake each time.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            timeout=_REQUEST_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            limits=httpx.Limits(keepalive_expiry=_KEEPALIVE_EXPIRY_SECONDS),
+        )
+        _ = atexit.register(_http_client.close)
+    return _http_client
+
+
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+
+class HostRateLimiter:
+    """
+    Token bucket (capacity 1) per host: at most one request per interval.
+
+    Time spent on the previous request counts toward the interval, so a
+    slow response is not followed by a full extra sleep. Slots are claimed
+    before waiting, so concurrent async callers queue up one interval apart.
+    """
+
+    def __init__(self, interval_seconds: float) -> None:
+        self.interval_seconds = interval_seconds
+        self._next_allowed: dict[str, float] = {}
+
+    def reserve(self, url: str, deadline: float | None = None) -> float | None:
+        """
+        Claim the next slot for url's host; returns seconds until it starts.
+
+        Returns None, claiming nothing, if the slot would start after the
+        time.monotonic() deadline.
+        """
+        host = urlsplit(url).netloc
+        now = time.monotonic()
+        start = max(self._next_allowed.get(host, now), now)
+        if deadline is not None and start >= deadline:
+            return None
+        self._next_allowed[host] = start + self.interval_seconds
+        if start > now:
+            logger.debug(f"Rate limit: waiting {start - now:.1f}s for {host}...")
+        return start - now
+
+    def acquire(self, url: str, deadline: float | None = None) -> bool:
+        """
+        Block until a request to url's host is allowed, then claim the slot.
+
+        Returns False at once, without waiting, if that would pass deadline.
+        """
+        wait = self.reserve(url, deadline)
+        if wait is None:
+            return False
+        time.sleep(wait)
+        return True
+
+    async def acquire_async(self, url: str) -> None:
+        """Async counterpart of acquire; other tasks run while it waits."""
+        await asyncio.sleep(self.reserve(url) or 0.0)
+
+
+# Shared by every fetch in the process (NOAA requires 10s between requests)
+_rate_limiter = HostRateLimiter(_RATE_LIMIT_SECONDS)
+
+
+# =============================================================================
+# CIRCUIT BREAKING
+# =============================================================================
+
+
+class HostCircuitBreaker:
+    """
+    Stop contacting a host after consecutive network errors or timeouts.
+
+    A run of connection failures or timeouts means the host is unreachable
+    or hung, and every fallback URL is on the same host, so further attempts
+    would only burn backoff and rate-limit sleeps. Only an actual response
+    from the host (even an error status) proves it reachable and resets its
+    count; other failures leave the count as it is.
+    """
+
+    def __init__(self, failure_limit: int) -> None:
+        self.failure_limit = failure_limit
+        self._failures: dict[str, int] = {}
+
+    def record(self, attempt: FetchAttempt) -> None:
+        """Count a network error or timeout against the host, or reset it."""
+        host = urlsplit(attempt.url).netloc
+        if attempt.status_code is not None:
+            self._failures[host] = 0
+        elif attempt.error_type in ("network_error", "timeout"):
+            self._failures[host] = self._failures.get(host, 0) + 1
+
+    def is_open(self, url: str) -> bool:
+        """True if url's host has failed too often to be worth trying."""
+        return self._failures.get(urlsplit(url).netloc, 0) >= self.failure_limit
+
+
+# =============================================================================
+# AVAILABILITY PROBING
+# =============================================================================
+
+
+async def probe_urls_async(urls: list[str]) -> list[int | None]:
+    """
+    Send a HEAD request to every URL concurrently.
+
+    Concurrency is bounded by noaa_settings.max_concurrent_downloads, as for
+    batch downloads, and each probe waits its turn at the shared per-host
+    rate limiter.
+
+    Returns:
+        Status code per URL, in order; None where the request itself failed
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_DOWNLOADS)
+
+    async def probe_one(client: httpx.AsyncClient, url: str) -> int | None:
+        await _rate_limiter.acquire_async(url)
+        async with semaphore:
+            try:
+                response = await client.head(url)
+            except httpx.HTTPError as e:
+                logger.debug(f"Probe failed: {type(e).__name__}: {e}")
+                return None
+            return response.status_code
+
+    async with httpx.AsyncClient(
+        timeout=_REQUEST_TIMEOUT_SECONDS,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=_MAX_CONCURRENT_DOWNLOADS),
+    ) as client:
+        return await asyncio.gather(*(probe_one(client, url) for url in urls))
+
+
+def drop_unavailable_urls(urls: list[str]) -> list[str]:
+    """
+    Probe all candidate URLs at once and drop the ones NOMADS reports missing.
+
+    Only 404s are dropped: 5xx and failed probes are kept so the normal
+    retry logic still gets a chance at them. Order (newest first) is kept.
+    """
+    statuses = asyncio.run(probe_urls_async(urls))
+    available = [
+        url
+        for url, status in zip(urls, statuses, strict=True)
+        if status != _HTTP_NOT_FOUND
+    ]
+    logger.info(f"Probe: {len(available)} of {len(urls)} forecast times available")
+    return available
+
+
+# =============================================================================
+# DNS CACHING
+# =============================================================================
+
+# (host, port, family, type, proto, flags) -> (expiry on monotonic clock, result)
+_dns_cache: dict[tuple[object, ...], tuple[float, list]] = {}  # pyright: ignore[reportMissingTypeArgument]
+
+# socket.getaddrinfo is process-wide, so nested or concurrent fetches share
+# one patch: the first to enter installs it and the last to leave restores it
+_dns_patch_lock = threading.Lock()
+_dns_patch_depth = 0
+_system_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):  # pyright: ignore[reportMissingParameterType, reportUnknownParameterType]
+    """socket.getaddrinfo replacement that reuses recent successful lookups."""
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    cached = _dns_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    result = _system_getaddrinfo(host, port, family, type, proto, flags)
+    _dns_cache[key] = (now + _DNS_CACHE_SECONDS, result)
+    return result
+
+
+@contextmanager
+def cached_dns_lookups() -> Iterator[None]:
+    """
+    Memoize socket.getaddrinfo for the duration of a fetch.
+
+    Every fallback URL and forecast hour goes to the same NOMADS host, but
+    each new connection (after a dropped keep-alive, or one per concurrent
+    batch download) would otherwise resolve it again. Successful lookups are
+    reused for http_settings.dns_cache_seconds; failures are never cached.
+    Safe to nest or enter from several threads: the original resolver is
+    restored only when the outermost context exits.
+    """
+    global _dns_patch_depth, _system_getaddrinfo
+    with _dns_patch_lock:
+        if _dns_patch_depth == 0:
+            _system_getaddrinfo = socket.getaddrinfo
+            socket.getaddrinfo = _cached_getaddrinfo  # pyright: ignore[reportAttributeAccessIssue]
+        _dns_patch_depth += 1
+    try:
+        yield
+    finally:
+        with _dns_patch_lock:
+            _dns_patch_depth -= 1
+            if _dns_patch_depth == 0:
+                socket.getaddrinfo = _system_getaddrinfo
+
+
 # =============================================================================
 # MAIN FETCH LOGIC
 # =============================================================================
 
 
+@cached_dns_lookups()
 def fetch_most_recent_forecast(
-    query_urls: Iterator[str],
+    query_urls: Iterable[str],
     output_path: Path,
+    deadline: float | None = None,
+    conditional_headers: dict[str, dict[str, str]] | None = None,
+    stage: bool = True,
 ) -> FetchResult:
     """
     Try each query URL until one succeeds, with retry logic.
@@ -242,45 +714,71 @@ def fetch_most_recent_forecast(
 
     Features:
     - Exponential backoff on transient errors (5xx, timeout)
+    - Circuit breaker: after retry_settings.network_failure_limit consecutive
+      network errors or timeouts on a host, its remaining URLs are skipped
     - Rate limiting between different forecast times (NOAA requirement)
     - Comprehensive attempt tracking for debugging
+    - Optional time.monotonic() deadline, checked before each request
+    - Optional conditional GET: conditional_headers maps a URL the caller
+      already holds to its If-None-Match / If-Modified-Since headers, and a
+      304 for it ends the fetch with not_modified set
+    - stage=False writes straight to output_path (see stream_to_file)
 
     Returns:
-        FetchResult with data (if successful) and all attempt metadata
+        FetchResult with bytes written (if successful) and all attempt metadata
     """
     start_time = time.time()
     all_attempts: list[FetchAttempt] = []
-    first_url = True
     url_count = 0
 
+    # Optionally find the live runs up front instead of walking 404s one
+    # rate-limited request at a time
+    if _PROBE_BEFORE_FETCH:
+        query_urls = drop_unavailable_urls(list(query_urls))
+
+    # Pooled client shared by every retry and fallback URL
+    client = get_http_client()
+    breaker = HostCircuitBreaker(_NETWORK_FAILURE_LIMIT)
     for url in query_urls:
-        url_count += 1
+        if breaker.is_open(url):
+            continue
 
-        # Rate limiting: wait between requests (NOAA requires 10s minimum)
-        if not first_url:
-            logger.debug(
-                f"Rate limit: waiting {settings.noaa_settings.rate_limit_seconds}s..."  # pyright: ignore[reportUnknownMemberType]
-            )
-            time.sleep(settings.noaa_settings.rate_limit_seconds)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-        first_url = False
+        # Rate limiting: wait only for what is left of the per-host interval,
+        # and not at all if the slot would come after the deadline
+        if not _rate_limiter.acquire(url, deadline):
+            logger.warning("Fetch deadline reached, not trying older forecasts")
+            break
+        url_count += 1
 
         # Try this URL with retry logic
-        response, attempts = fetch_with_exponential_backoff(url)
+        bytes_written, attempts = fetch_with_exponential_backoff(
+            client,
+            url,
+            output_path,
+            deadline=deadline,
+            headers=conditional_headers.get(url) if conditional_headers else None,
+            breaker=breaker,
+            stage=stage,
+        )
         all_attempts.extend(attempts)
 
-        if (
-            response is not None
-            and response.status_code == settings.http_settings.success  # pyright: ignore[reportUnknownMemberType]
-        ):
-            # Success! Save and return
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            _ = output_path.write_bytes(response.content)
+        if attempts and attempts[-1].status_code == _HTTP_NOT_MODIFIED:
+            # Caller's copy of this run is current; nothing was downloaded
+            return FetchResult(
+                bytes_written=None,
+                attempts=all_attempts,
+                success=True,
+                total_duration_seconds=time.time() - start_time,
+                not_modified=True,
+            )
 
+        if bytes_written is not None:
+            # Success! Body was streamed straight to output_path
             duration = time.time() - start_time
             logger.info(f"Successfully downloaded to {output_path}")
 
             return FetchResult(
-                data=response.content,
+                bytes_written=bytes_written,
                 attempts=all_attempts,
                 success=True,
                 total_duration_seconds=duration,
@@ -294,7 +792,7 @@ def fetch_most_recent_forecast(
     )
 
     return FetchResult(
-        data=None,
+        bytes_written=None,
         attempts=all_attempts,
         success=False,
         total_duration_seconds=duration,
@@ -302,9 +800,11 @@ def fetch_most_recent_forecast(
 
 
 def fetch_with_timeout(
-    query_urls: Iterator[str],
+    query_urls: Iterable[str],
     output_path: Path,
     timeout_minutes: float | None = None,
+    conditional_headers: dict[str, dict[str, str]] | None = None,
+    stage: bool = True,
 ) -> FetchResult:
     """
     Fetch with overall timeout across all retries.
@@ -312,28 +812,80 @@ def fetch_with_timeout(
     Useful for automated scripts that need predictable failure times
     rather than exhausting all retries (which could take a long time).
 
-    Note: Uses SIGALRM which only works on Unix systems. On Windows,
-    falls back to no timeout.
+    The timeout is a monotonic-clock deadline, so it works on every platform
+    and from any thread. It is checked before each request, before each
+    backoff sleep (a retry that would start after it is skipped) and after
+    every downloaded chunk. The only overshoot is a single blocking network
+    read, at most http_settings.request_timeout_seconds. On expiry the
+    failed FetchResult is returned rather than raised.
     """
-    import signal
-
     if timeout_minutes is None:
-        timeout_minutes = settings.retry_settings.timeout_minutes  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        timeout_minutes = _TIMEOUT_MINUTES
+
+    deadline = time.monotonic() + timeout_minutes * 60
+    return fetch_most_recent_forecast(
+        query_urls,
+        output_path,
+        deadline=deadline,
+        conditional_headers=conditional_headers,
+        stage=stage,
+    )
 
-    def timeout_handler(signum, frame):  # pyright: ignore[reportUnusedParameter, reportMissingParameterType, reportUnknownParameterType]
-        raise TimeoutError(f"Fetch exceeded {timeout_minutes} minute timeout")
 
-    # Set alarm (Unix/Mac only - gracefully degrades on Windows)
-    try:
-        _ = signal.signal(signal.SIGALRM, timeout_handler)  # pyright: ignore[reportUnknownArgumentType]
-        _ = signal.alarm(int(timeout_minutes * 60))  # pyright: ignore[reportOptionalOperand, reportUnknownArgumentType]
+# =============================================================================
+# BATCH FETCH LOGIC
+# =============================================================================
+
 
-        result = fetch_most_recent_forecast(query_urls, output_path)
+async def fetch_batch_async(
+    downloads: dict[str, Path], stage: bool = True
+) -> list[FetchResult]:
+    """
+    Download several files concurrently over one pooled AsyncClient.
 
-        _ = signal.alarm(0)  # Cancel alarm
-        return result
+    Intended for forecast hours of a run already confirmed by its analysis
+    file, so there is no fallback between URLs. Requests start no faster
+    than the shared per-host rate limiter allows, and at most
+    noaa_settings.max_concurrent_downloads bodies stream at once. stage is
+    passed through to stream_to_file.
 
-    except AttributeError:
-        # Windows or signal not available - just run without timeout
-        logger.warning("Timeout not supported on this platform, running without")
-        return fetch_most_recent_forecast(query_urls, output_path)
+    Returns:
+        One FetchResult per download, in the order of `downloads`
+    """
+    max_concurrent = _MAX_CONCURRENT_DOWNLOADS
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def fetch_one(
+        client: httpx.AsyncClient, url: str, output_path: Path
+    ) -> FetchResult:
+        start_time = time.time()
+        await _rate_limiter.acquire_async(url)
+        async with semaphore:
+            bytes_written, attempts = await fetch_with_exponential_backoff_async(
+                client, url, output_path, stage=stage
+            )
+            return FetchResult(
+                bytes_written=bytes_written,
+                attempts=attempts,
+                success=bytes_written is not None,
+                total_duration_seconds=time.time() - start_time,
+            )
+
+    async with httpx.AsyncClient(
+        timeout=_REQUEST_TIMEOUT_SECONDS,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=max_concurrent),
+    ) as client:
+        return await asyncio.gather(
+            *(fetch_one(client, url, path) for url, path in downloads.items())
+        )
+
+
+@cached_dns_lookups()
+def fetch_batch(downloads: dict[str, Path], stage: bool = True) -> list[FetchResult]:
+    """
+    Synchronous entry point for fetch_batch_async.
+
+    Maps each URL to its output path; returns one FetchResult per download.
+    """
+    return asyncio.run(fetch_batch_async(downloads, stage))
@@ -11,9 +11,11 @@ Key features:
 """
 
 import pathlib
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from urllib.parse import urlencode
+from functools import cached_property, lru_cache
+from urllib.parse import quote_plus, urlencode
 
 import pydantic
 
@@ -34,13 +36,15 @@ class QueryModel(pydantic.BaseModel, frozen=True):
     Product-specific query configuration.
 
     Defines NOAA URL patterns and file naming for a specific product
-    (e.g., gfs_quarter_degree).
+    (e.g., gfs_quarter_degree). `file` names the analysis file; the optional
+    `forecast_file` names forecast-hour files via a `{forecast_hour}` field.
     """
 
     name: str
     filter: str
     file: str
     dir: str
+    forecast_file: str | None = None
 
 
 class QueryMask(pydantic.BaseModel, frozen=True):
@@ -54,8 +58,14 @@ class QueryMask(pydantic.BaseModel, frozen=True):
     levels: str
 
 
-class QueryTime(pydantic.BaseModel, frozen=True):
-    """Forecast run timestamp for NOAA GFS data."""
+@dataclass(frozen=True, slots=True)
+class QueryTime:
+    """
+    Forecast run timestamp for NOAA GFS data.
+
+    A slotted dataclass rather than a model: several are built per fetch
+    from values this module formats itself, so there is nothing to validate.
+    """
 
     date_utc: str  # Format: YYYYMMDD
     cycle_hour_utc: str  # Format: HH (00, 06, 12, 18)
@@ -73,11 +83,13 @@ class SelectedKeys(pydantic.BaseModel, frozen=True):
     prefix: str
 
 
-class BoundingBox(pydantic.BaseModel, frozen=True):
+@dataclass(frozen=True, slots=True)
+class BoundingBox:
     """
     Geographic bounding box for data request.
 
-    Coordinates in degrees, following NOAA API conventions.
+    Coordinates in degrees, following NOAA API conventions. Only built by
+    create_bounding_box from already-validated LocationSettings.
     """
 
     toplat: float
@@ -127,6 +139,11 @@ class QueryStructure(pydantic.BaseModel, frozen=True):
     current_time: datetime
     settings: CoreSettings
 
+    @cached_property
+    def url_prefix(self) -> str:
+        """Base filter-service URI for the product (grib_url with its filter)."""
+        return self.settings.grib_url.format(filter=self.query_model.filter)
+
 
 # =============================================================================
 # GEOGRAPHIC UTILITIES
@@ -136,6 +153,8 @@ class QueryStructure(pydantic.BaseModel, frozen=True):
 def clamp_latitude(latitude: float) -> float:
     """Constrain latitude to valid range [-90, 90]."""
 
+    if -90.0 <= latitude <= 90.0:
+        return latitude  # Common case: nothing to clamp
     return max(-90.0, min(90.0, latitude))
 
 
@@ -143,10 +162,14 @@ def normalize_longitude(longitude: float) -> float:
     """
     Normalize longitude to [0, 360) range.
 
-    NOAA API expects 0-360 format, not -180 to 180.
+    NOAA API expects 0-360 format, not -180 to 180. Python's % already
+    takes the sign of the divisor, so negatives need no extra correction.
+    Values already inside (0, 360) are returned as-is; zero still goes
+    through % so -0.0 comes out as 0.0.
     """
-    normalized = longitude % 360
-    return normalized if normalized >= 0 else normalized + 360
+    if 0.0 < longitude < 360.0:
+        return longitude
+    return longitude % 360
 
 
 def calculate_latitude_bounds(
@@ -169,9 +192,11 @@ def calculate_longitude_bounds(
 
     normalized_longitude = normalize_longitude(center_lon)
     half_width = width_degrees / 2
-    min_lon = normalize_longitude(normalized_longitude - half_width)
-    max_lon = normalize_longitude(normalized_longitude + half_width)
-    return min_lon, max_lon
+    min_lon = normalized_longitude - half_width
+    max_lon = normalized_longitude + half_width
+    if min_lon > 0.0 and max_lon < 360.0:
+        return min_lon, max_lon  # Box doesn't cross 0°: both already in range
+    return normalize_longitude(min_lon), normalize_longitude(max_lon)
 
 
 def create_bounding_box(ls: LocationSettings) -> BoundingBox:
@@ -241,6 +266,13 @@ def build_qt(dt_object: datetime, qs: QueryStructure) -> QueryTime:
     )
 
 
+def qt_to_datetime(qt: QueryTime) -> datetime:
+    """Convert NOAA query time back to its run start as a UTC datetime."""
+    return datetime.strptime(qt.date_utc + qt.cycle_hour_utc, "%Y%m%d%H").replace(
+        tzinfo=timezone.utc
+    )
+
+
 def generate_qt_batch(
     reference_time: datetime,
     qs: QueryStructure,
@@ -255,25 +287,29 @@ def generate_qt_batch(
     Special logic: if latest run started less than 3 hours ago, skip it
     since NOAA processing typically takes 3+ hours.
     """
-    cropped_time = crop_to_hour(reference_time)
-    latest_run_start = get_latest_run_start(cropped_time, qs)
-
-    # Skip very recent run if it started less than 3 hours ago
-    if latest_run_start + timedelta(hours=3) <= datetime.now(tz=timezone.utc):
-        latest_cycle = cropped_time.replace(hour=latest_run_start.hour)
-    else:
-        # Too recent, try previous cycle
-        latest_cycle = cropped_time.replace(
-            hour=(latest_run_start - timedelta(hours=6)).hour,
+    step = timedelta(hours=qs.settings.forecast_interval_hours)
+    latest_cycle = get_latest_run_start(crop_to_hour(reference_time), qs)
+
+    # Skip very recent run if it started less than 3 hours before reference_time
+    # (the caller's single "now", rather than a second clock read here); for
+    # the 00 run this steps back to the previous day
+    if latest_cycle + timedelta(hours=3) > reference_time:
+        latest_cycle -= step
+
+    # Stepping back by whole intervals stays on cycle hours, so each
+    # candidate is one subtraction instead of a build_qt call
+    candidates = (
+        latest_cycle - step * i
+        for i in range(
+            qs.settings.max_lookback_hours // qs.settings.forecast_interval_hours + 1
         )
-
+    )
     return tuple(
-        build_qt(dt_object=latest_cycle - timedelta(hours=offset), qs=qs)
-        for offset in range(
-            0,
-            qs.settings.max_lookback_hours + 1,
-            qs.settings.forecast_interval_hours,
+        QueryTime(
+            date_utc=format_date_utc(dt_object=candidate),
+            cycle_hour_utc=f"{candidate.hour:02}",
         )
+        for candidate in candidates
     )
 
 
@@ -288,8 +324,18 @@ def get_binary_mask_from_hex(hex_mask: str, mask_length: int) -> tuple[int, ...]
 
     E.g., "0xF" with length 4 -> (1, 1, 1, 1)
     """
-    binary_string = format(int(hex_mask, base=16), "b").rjust(mask_length, "0")
-    return tuple(int(value) for value in binary_string)
+    mask = int(hex_mask, base=16)
+    width = max(mask_length, mask.bit_length() or 1)
+    return tuple((mask >> shift) & 1 for shift in range(width - 1, -1, -1))
+
+
+def url_encode_keys(selected_keys: Iterable[str], prefix: str) -> str:
+    """
+    Convert already-selected keys to URL-encoded query string.
+
+    E.g., ["TMP", "UGRD"] with prefix "var_" -> "var_TMP=on&var_UGRD=on"
+    """
+    return urlencode([(f"{prefix}{key}", "on") for key in selected_keys])
 
 
 def get_url_encoded_keys(all_keys: list[str], hex_mask: str, prefix: str) -> str:
@@ -300,9 +346,20 @@ def get_url_encoded_keys(all_keys: list[str], hex_mask: str, prefix: str) -> str
     E.g., ["TMP", "UGRD"] with mask 0x3 and prefix "var_" ->
     "var_TMP=on&var_UGRD=on"
     """
-    binary_mask = get_binary_mask_from_hex(hex_mask=hex_mask, mask_length=len(all_keys))
-    return urlencode(
-        [(f"{prefix}{key}", "on") for key, mask in zip(all_keys, binary_mask) if mask]
+    return encode_masked_keys(tuple(all_keys), hex_mask, prefix)
+
+
+@lru_cache(maxsize=64)
+def encode_masked_keys(all_keys: tuple[str, ...], hex_mask: str, prefix: str) -> str:
+    """
+    Cached core of get_url_encoded_keys (arguments must be hashable).
+
+    The same key list and mask are encoded for every URL of a run, so the
+    decode and urlencode happen once per process per (keys, mask, prefix).
+    """
+    return url_encode_keys(
+        selected_keys=reveal_masked_values(all_values=all_keys, hex_mask=hex_mask),
+        prefix=prefix,
     )
 
 
@@ -313,20 +370,23 @@ def build_new_mask(all_values: list[str], selected_values: tuple[str, ...]) -> s
     Inverse of reveal_masked_values. Creates mask where bit is 1
     if value is selected.
     """
-    raw_mask = ["1" if key in selected_values else "0" for key in all_values]
-    return hex(int("".join(raw_mask), 2))
+    selected = set(selected_values)
+    mask = 0
+    for key in all_values:
+        mask = (mask << 1) | (key in selected)
+    return hex(mask)
 
 
-def reveal_masked_values(all_values: list[str], hex_mask: str) -> list[str]:
+def reveal_masked_values(all_values: Sequence[str], hex_mask: str) -> list[str]:
     """
     Decode hexadecimal mask to list of selected values.
 
-    Returns only values where mask bit is 1.
+    Returns only values where mask bit is 1. The first value maps to the
+    most significant bit; bits are tested directly on the integer mask.
     """
-    binary_mask = get_binary_mask_from_hex(
-        hex_mask=hex_mask, mask_length=len(all_values)
-    )
-    return [key for key, mask in zip(all_values, binary_mask) if mask]
+    mask = int(hex_mask, base=16)
+    top_bit = max(len(all_values), mask.bit_length()) - 1
+    return [key for i, key in enumerate(all_values) if (mask >> (top_bit - i)) & 1]
 
 
 # =============================================================================
@@ -334,52 +394,142 @@ def reveal_masked_values(all_values: list[str], hex_mask: str) -> list[str]:
 # =============================================================================
 
 
-def collect_query_arguments(qs: QueryStructure) -> tuple[str, str, str]:
+@lru_cache(maxsize=64)
+def encode_subregion(bb: BoundingBox) -> str:
+    """
+    URL-encoded subregion argument for a bounding box.
+
+    Coordinates are plain floats whose str() (digits, ".", "-", "e") needs
+    no quoting, so this matches urlencode's output without calling it.
+    """
+    return (
+        f"subregion=toplat={bb.toplat}&leftlon={bb.leftlon}"  # pyright: ignore[reportImplicitStringConcatenation]
+        f"&rightlon={bb.rightlon}&bottomlat={bb.bottomlat}"
+    )
+
+
+def collect_query_arguments(qs: QueryStructure) -> str:
     """
     Build URL query arguments from query structure.
 
-    Returns tuple of: (variables_string, levels_string, subregion_string)
-    All encoded for URL inclusion.
+    Returns "{variables}&{levels}&{subregion}", encoded and joined ready to
+    append to a URL. Each part is cached on its (hashable) inputs, so
+    repeat calls for an equal query are lookups.
     """
-    variables = get_url_encoded_keys(**qs.variables.model_dump())  # pyright: ignore[reportAny]
-    levels = get_url_encoded_keys(**qs.levels.model_dump())  # pyright: ignore[reportAny]
-    subregion = "=".join(["subregion", urlencode(query=qs.bounding_box.model_dump())])
+    variables = get_url_encoded_keys(
+        qs.variables.all_keys, qs.variables.hex_mask, qs.variables.prefix
+    )
+    levels = get_url_encoded_keys(
+        qs.levels.all_keys, qs.levels.hex_mask, qs.levels.prefix
+    )
+    subregion = encode_subregion(qs.bounding_box)
 
-    return variables, levels, subregion
+    return f"{variables}&{levels}&{subregion}"
 
 
-def build_query_url(qt: QueryTime, qa: tuple[str, str, str], qs: QueryStructure) -> str:
+def format_file_name(
+    qt: QueryTime, query_model: QueryModel, forecast_hour: int | None
+) -> str:
     """
-    Construct complete NOAA query URL from components.
+    Format the product file name for a run.
 
-    Combines base URI, file/dir parameters, and query arguments
-    (variables, levels, subregion).
+    Uses the analysis `file` template, or `forecast_file` when a forecast
+    hour is given. Raises ValueError if the product has no forecast_file.
     """
-    uri = qs.settings.grib_url.format(
-        filter=qs.query_model.filter,
-    )
-    core = urlencode(
-        (
-            (
-                "dir",
-                qs.query_model.dir.format(**qt.model_dump()),  # pyright: ignore[reportAny]
-            ),
-            (
-                "file",
-                qs.query_model.file.format(**qt.model_dump()),  # pyright: ignore[reportAny]
-            ),
+    if forecast_hour is None:
+        return query_model.file.format(
+            date_utc=qt.date_utc, cycle_hour_utc=qt.cycle_hour_utc
         )
+
+    if query_model.forecast_file is None:
+        raise ValueError(f"Product {query_model.name} does not define forecast_file")
+    return query_model.forecast_file.format(
+        date_utc=qt.date_utc,
+        cycle_hour_utc=qt.cycle_hour_utc,
+        forecast_hour=forecast_hour,
+    )
+
+
+@lru_cache(maxsize=256)
+def encode_dir_file(
+    query_model: QueryModel, qt: QueryTime, forecast_hour: int | None
+) -> str:
+    """
+    URL-encoded "dir=...&file=..." for one product file, cached per run.
+
+    Quoted as urlencode would, so "/" in dir is still sent as %2F.
+    """
+    dir_q = quote_plus(
+        query_model.dir.format(date_utc=qt.date_utc, cycle_hour_utc=qt.cycle_hour_utc),
+        safe="",
+    )
+    file_q = quote_plus(
+        format_file_name(qt=qt, query_model=query_model, forecast_hour=forecast_hour),
+        safe="",
     )
-    query_string = "&".join([core, *qa])
-    return f"{uri}?{query_string}"
+    return f"dir={dir_q}&file={file_q}"
+
+
+def build_query_url(
+    qt: QueryTime,
+    qa: str,
+    qs: QueryStructure,
+    forecast_hour: int | None = None,
+) -> str:
+    """
+    Construct complete NOAA query URL from components.
+
+    Combines base URI, file/dir parameters, and the joined query arguments
+    from collect_query_arguments. Without forecast_hour the URL
+    targets the analysis file. The base URI is cached on qs (url_prefix).
+    """
+    core = encode_dir_file(qs.query_model, qt, forecast_hour)
+    return f"{qs.url_prefix}?{core}&{qa}"
 
 
 def generate_query_urls(
     qt_batch: tuple[QueryTime, ...],
     qs: QueryStructure,
 ) -> Generator[str, None, None]:
-    """Generate query URLs in order from most to least recent."""
+    """
+    Generate query URLs in order from most to least recent.
 
+    Lazy: each URL is built only when the caller asks for it, so a fetch that
+    succeeds on the first run never formats the fallback URLs.
+    """
+    # qs is frozen, so the query arguments are the same for every run
+    qa = collect_query_arguments(qs=qs)
     for qt in qt_batch:
-        qa = collect_query_arguments(qs=qs)
         yield build_query_url(qt=qt, qa=qa, qs=qs)
+
+
+def build_query_urls(
+    qt_batch: tuple[QueryTime, ...],
+    qs: QueryStructure,
+) -> list[str]:
+    """
+    Build all query URLs for qt_batch at once, most recent first.
+
+    For callers that need every URL anyway (e.g. to index them or probe
+    them together): one comprehension over shared query arguments instead
+    of resuming a generator per URL.
+    """
+    qa = collect_query_arguments(qs=qs)
+    return [build_query_url(qt=qt, qa=qa, qs=qs) for qt in qt_batch]
+
+
+def generate_forecast_hour_urls(
+    qt: QueryTime,
+    forecast_hours: tuple[int, ...],
+    qs: QueryStructure,
+) -> dict[int, str]:
+    """
+    Build query URLs for forecast hours of a single (confirmed) run.
+
+    Returns mapping of forecast hour to URL, in the order given.
+    """
+    qa = collect_query_arguments(qs=qs)
+    return {
+        hour: build_query_url(qt=qt, qa=qa, qs=qs, forecast_hour=hour)
+        for hour in forecast_hours
+    }
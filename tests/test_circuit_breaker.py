@@ -0,0 +1,75 @@
+"""
+Tests for the per-host circuit breaker.
+
+Network errors and timeouts count toward the limit; any HTTP response resets it.
+"""
+
+from datetime import datetime, timezone
+
+from noaa_grib_fetcher import FetchAttempt, HostCircuitBreaker
+
+URL = "https://nomads.example.gov/cgi-bin/filter.pl?file=a"
+OTHER_HOST_URL = "https://mirror.example.gov/cgi-bin/filter.pl?file=a"
+
+
+def attempt(status_code: int | None, error_type: str | None) -> FetchAttempt:
+    """Attempt record for URL with the given outcome."""
+    return FetchAttempt(
+        url=URL,
+        status_code=status_code,
+        error_type=error_type,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+# =============================================================================
+# OPENING TESTS
+# =============================================================================
+
+
+def test_breaker_opens_after_consecutive_network_errors():
+    """The host is cut off once the failure limit is reached."""
+    breaker = HostCircuitBreaker(failure_limit=2)
+    breaker.record(attempt(None, "network_error"))
+    assert not breaker.is_open(URL)
+    breaker.record(attempt(None, "network_error"))
+    assert breaker.is_open(URL)
+
+
+def test_breaker_counts_timeouts():
+    """Timeouts count toward the limit alongside network errors."""
+    breaker = HostCircuitBreaker(failure_limit=2)
+    breaker.record(attempt(None, "timeout"))
+    breaker.record(attempt(None, "network_error"))
+    assert breaker.is_open(URL)
+
+
+def test_breaker_is_per_host():
+    """Failures on one host do not open the breaker for another."""
+    breaker = HostCircuitBreaker(failure_limit=1)
+    breaker.record(attempt(None, "network_error"))
+    assert breaker.is_open(URL)
+    assert not breaker.is_open(OTHER_HOST_URL)
+
+
+# =============================================================================
+# RESET TESTS
+# =============================================================================
+
+
+def test_breaker_resets_on_any_response():
+    """An HTTP response, even an error status, proves the host reachable."""
+    breaker = HostCircuitBreaker(failure_limit=2)
+    breaker.record(attempt(None, "network_error"))
+    breaker.record(attempt(500, "server_error"))
+    breaker.record(attempt(None, "timeout"))
+    assert not breaker.is_open(URL)
+
+
+def test_breaker_ignores_failures_without_response():
+    """Other failures with no response neither count nor reset."""
+    breaker = HostCircuitBreaker(failure_limit=2)
+    breaker.record(attempt(None, "network_error"))
+    breaker.record(attempt(None, "unknown_error"))
+    breaker.record(attempt(None, "network_error"))
+    assert breaker.is_open(URL)
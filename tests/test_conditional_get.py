@@ -0,0 +1,110 @@
+"""
+Tests for conditional GETs against a downloaded file's validators sidecar.
+
+A fake NOMADS answers 304 to a matching If-None-Match and sends the full
+body otherwise.
+"""
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+import noaa_grib_fetcher
+from fetch_forecast import load_conditional_headers, save_validators
+from noaa_grib_fetcher import (
+    HostRateLimiter,
+    fetch_most_recent_forecast,
+    part_path_for,
+)
+
+URL = "https://nomads.example.gov/cgi-bin/filter.pl?file=a"
+BODY = b"GRIB" * 1000
+ETAG = '"v1"'
+
+
+@pytest.fixture
+def requests(monkeypatch: pytest.MonkeyPatch) -> list[httpx.Request]:
+    """Route the shared client to the fake server; returns the requests it saw."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("If-None-Match") == ETAG:
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": ETAG}, content=BODY)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(noaa_grib_fetcher, "_http_client", client)
+    monkeypatch.setattr(noaa_grib_fetcher, "_rate_limiter", HostRateLimiter(0))
+    return seen
+
+
+def download(output_path: Path, headers: dict[str, dict[str, str]]):
+    """Fetch URL the way the CLI does: into the .part path, installed by hand."""
+    staged = part_path_for(output_path)
+    result = fetch_most_recent_forecast(
+        [URL], staged, conditional_headers=headers, stage=False
+    )
+    if result.bytes_written:
+        staged.replace(output_path)
+        save_validators(output_path, result.attempts[-1])
+    return result
+
+
+# =============================================================================
+# NOT MODIFIED TESTS
+# =============================================================================
+
+
+def test_not_modified_keeps_existing_file(
+    tmp_path: Path, requests: list[httpx.Request]
+):
+    """A 304 for an intact copy ends the fetch without touching the file."""
+    output_path = tmp_path / "run.grib"
+    _ = download(output_path, {})
+
+    result = download(output_path, load_conditional_headers(output_path))
+
+    assert result.success and result.not_modified
+    assert requests[-1].headers["If-None-Match"] == ETAG
+    assert output_path.read_bytes() == BODY
+    assert not part_path_for(output_path).exists()
+
+
+# =============================================================================
+# DIGEST MISMATCH TESTS
+# =============================================================================
+
+
+def test_truncated_file_is_downloaded_in_full(
+    tmp_path: Path, requests: list[httpx.Request]
+):
+    """A size mismatch drops the conditional headers."""
+    output_path = tmp_path / "run.grib"
+    _ = download(output_path, {})
+    _ = output_path.write_bytes(BODY[:100])
+
+    headers = load_conditional_headers(output_path)
+    result = download(output_path, headers)
+
+    assert headers == {}
+    assert "If-None-Match" not in requests[-1].headers
+    assert result.bytes_written == len(BODY)
+    assert output_path.read_bytes() == BODY
+
+
+def test_edited_file_is_downloaded_in_full(
+    tmp_path: Path, requests: list[httpx.Request]
+):
+    """Same size but different content fails the SHA-256 check."""
+    output_path = tmp_path / "run.grib"
+    _ = download(output_path, {})
+    _ = output_path.write_bytes(BODY[::-1])
+
+    assert load_conditional_headers(output_path) == {}
+    result = download(output_path, {})
+
+    assert "If-None-Match" not in requests[-1].headers
+    assert output_path.read_bytes() == BODY
+    assert result.bytes_written == len(BODY)
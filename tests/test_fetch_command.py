@@ -0,0 +1,176 @@
+"""
+Tests for the fetch command's file handling and run selection.
+
+The network layer is replaced by fakes that write small files: the newest
+run answers 404 and the next one succeeds, so every fetch falls back once.
+"""
+
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+import fetch_forecast
+import noaa_grib_fetcher
+from noaa_grib_fetcher import FetchAttempt, FetchResult
+from noaa_query_builder import CoreSettings, QueryTime
+
+FETCH = [
+    "fetch",
+    "-p",
+    "sailing_basic",
+    "--lat",
+    "45",
+    "--lon",
+    "-93",
+    "--height",
+    "10",
+    "--width",
+    "10",
+    "--force",
+]
+
+
+def run_stamp(url: str) -> str:
+    """YYYYMMDD_HH of the run a query URL asks for."""
+    match = re.search(r"gfs\.(\d{8})%2F(\d{2})%2F", url)
+    assert match is not None
+    return f"{match[1]}_{match[2]}"
+
+
+def attempt(url: str, status_code: int) -> FetchAttempt:
+    """Attempt record for url with the given status."""
+    return FetchAttempt(
+        url=url,
+        status_code=status_code,
+        error_type=None,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+@pytest.fixture
+def storage(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run the command against tmp_path with logging setup skipped."""
+    core_settings = CoreSettings(
+        grib_url="https://nomads.ncep.noaa.gov/cgi-bin/{filter}",
+        output_dir=tmp_path,
+        forecast_interval_hours=6,
+        max_lookback_hours=18,
+    )
+    monkeypatch.setattr(fetch_forecast, "ensure_storage_configured", lambda: tmp_path)
+    monkeypatch.setattr(fetch_forecast, "get_core_settings", lambda: core_settings)
+    monkeypatch.setattr(fetch_forecast, "setup_logging", lambda: None)
+    return tmp_path
+
+
+@pytest.fixture
+def fetches(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Fake the fetcher; returns the query URLs each analysis fetch was given."""
+    calls: list[list[str]] = []
+
+    def fake_fetch_with_timeout(
+        query_urls: list[str], output_path: Path, **kwargs: object
+    ) -> FetchResult:
+        calls.append(list(query_urls))
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _ = output_path.write_bytes(b"analysis")
+        return FetchResult(
+            bytes_written=8,
+            attempts=[attempt(query_urls[0], 404), attempt(query_urls[1], 200)],
+            success=True,
+            total_duration_seconds=0.0,
+        )
+
+    def fake_fetch_batch(
+        downloads: dict[str, Path], **kwargs: object
+    ) -> list[FetchResult]:
+        results: list[FetchResult] = []
+        for url, path in downloads.items():
+            assert run_stamp(url) == run_stamp(calls[-1][1])
+            _ = path.write_bytes(b"hour")
+            results.append(FetchResult(4, [attempt(url, 200)], True, 0.0))
+        return results
+
+    monkeypatch.setattr(
+        noaa_grib_fetcher, "fetch_with_timeout", fake_fetch_with_timeout
+    )
+    monkeypatch.setattr(noaa_grib_fetcher, "fetch_batch", fake_fetch_batch)
+    return calls
+
+
+def run_fetch(*extra: str) -> None:
+    """Invoke the fetch command and require it to succeed."""
+    result = CliRunner().invoke(fetch_forecast.app, [*FETCH, *extra])
+    assert result.exit_code == 0, result.output
+
+
+# =============================================================================
+# RUN FOLDER TESTS
+# =============================================================================
+
+
+def test_fallback_run_keeps_analysis_and_hours_together(
+    storage: Path, fetches: list[list[str]]
+):
+    """When the newest run is missing, every file lands in the older run's folder."""
+    run_fetch("--no-cache", "--hours", "6,12")
+    confirmed = run_stamp(fetches[0][1])
+
+    grib_files = sorted(storage.rglob("*.grib"))
+    assert [path.name[12:15] for path in grib_files] == ["000", "006", "012"]
+    assert {path.parent for path in grib_files} == {grib_files[0].parent}
+    assert grib_files[0].parent.name.startswith(confirmed)
+    assert grib_files[0].name.startswith(confirmed)
+
+    # Nothing is left behind in the newest run's folder
+    assert not list(storage.rglob("*.part"))
+    assert not (storage / f"{run_stamp(fetches[0][0])}_GFS_sailing_basic").exists()
+
+
+# =============================================================================
+# LAST-SUCCESS CACHE TESTS
+# =============================================================================
+
+
+def test_last_success_run_requires_same_newest_candidate(tmp_path: Path):
+    """The cached run is ignored once the newest candidate has moved on."""
+    confirmed = QueryTime("20250101", "00")
+    newest = QueryTime("20250101", "06")
+    fetch_forecast.save_last_success_run(tmp_path, "GFS", "p", confirmed, newest)
+
+    assert fetch_forecast.load_last_success_run(tmp_path, "GFS", "p", 60, newest) == (
+        "20250101",
+        "00",
+    )
+    newer = QueryTime("20250101", "12")
+    assert fetch_forecast.load_last_success_run(tmp_path, "GFS", "p", 60, newer) is None
+
+
+def test_fetch_starts_from_cached_run(storage: Path, fetches: list[list[str]]):
+    """A fresh cache skips the newer runs that 404'd last time."""
+    run_fetch("--no-cache")
+    run_fetch()
+
+    assert run_stamp(fetches[1][0]) == run_stamp(fetches[0][1])
+    assert fetches[1] == fetches[0][1:]
+
+
+def test_fetch_retries_newest_run_when_a_new_cycle_is_due(
+    storage: Path, fetches: list[list[str]]
+):
+    """A cache recorded under an older newest candidate does not skip runs."""
+    run_fetch("--no-cache")
+
+    # Pretend the cache was written one cycle earlier: a newer run is now due
+    cache_file = storage / "_last_success.json"
+    cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    cached["newest_date_utc"], cached["newest_cycle_hour_utc"] = run_stamp(
+        fetches[0][1]
+    ).split("_")
+    _ = cache_file.write_text(json.dumps(cached), encoding="utf-8")
+
+    run_fetch()
+    assert fetches[1] == fetches[0]
@@ -0,0 +1,134 @@
+"""
+Tests for the fetcher's rate limiter, DNS cache and download deadline.
+"""
+
+import socket
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+import noaa_grib_fetcher
+from noaa_grib_fetcher import (
+    HostRateLimiter,
+    cached_dns_lookups,
+    fetch_with_retry,
+    part_path_for,
+)
+
+URL = "https://nomads.example.gov/cgi-bin/filter.pl?file=a"
+OTHER_HOST_URL = "https://mirror.example.gov/cgi-bin/filter.pl?file=a"
+
+
+# =============================================================================
+# RATE LIMITER TESTS
+# =============================================================================
+
+
+def test_rate_limiter_spaces_requests_per_host():
+    """Each claimed slot on a host starts one interval after the last."""
+    limiter = HostRateLimiter(10.0)
+    assert limiter.reserve(URL) == 0.0
+    assert limiter.reserve(URL) == pytest.approx(10.0, abs=0.1)
+    assert limiter.reserve(URL) == pytest.approx(20.0, abs=0.1)
+    assert limiter.reserve(OTHER_HOST_URL) == 0.0
+
+
+def test_rate_limiter_declines_slot_after_deadline():
+    """A slot past the deadline is refused at once and not claimed."""
+    limiter = HostRateLimiter(10.0)
+    assert limiter.acquire(URL)
+
+    start = time.monotonic()
+    assert not limiter.acquire(URL, deadline=start + 1.0)
+    assert time.monotonic() - start < 0.5
+    assert limiter.reserve(URL) == pytest.approx(10.0, abs=0.5)
+
+
+# =============================================================================
+# DNS CACHE TESTS
+# =============================================================================
+
+
+@pytest.fixture
+def lookups(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replace the system resolver with a counting fake; returns hosts looked up."""
+    hosts: list[str] = []
+
+    def fake_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):  # pyright: ignore[reportMissingParameterType, reportUnknownParameterType]
+        hosts.append(host)  # pyright: ignore[reportUnknownArgumentType]
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+
+    monkeypatch.setattr(socket, "getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(noaa_grib_fetcher, "_dns_cache", {})
+    return hosts
+
+
+def test_dns_lookups_are_reused_inside_context(lookups: list[str]):
+    """Repeated lookups inside the context resolve once."""
+    resolver = socket.getaddrinfo
+    with cached_dns_lookups():
+        _ = socket.getaddrinfo("nomads.example.gov", 443)
+        _ = socket.getaddrinfo("nomads.example.gov", 443)
+    assert lookups == ["nomads.example.gov"]
+    assert socket.getaddrinfo is resolver
+
+
+def test_nested_dns_contexts_restore_on_outermost_exit(lookups: list[str]):
+    """An inner exit leaves the cache installed; the outer one restores."""
+    resolver = socket.getaddrinfo
+    with cached_dns_lookups():
+        with cached_dns_lookups():
+            pass
+        assert socket.getaddrinfo is not resolver
+    assert socket.getaddrinfo is resolver
+
+
+def test_overlapping_dns_contexts_restore_on_last_exit(lookups: list[str]):
+    """Contexts in different threads may exit in any order."""
+    resolver = socket.getaddrinfo
+    entered, release = threading.Event(), threading.Event()
+
+    def hold_context() -> None:
+        with cached_dns_lookups():
+            entered.set()
+            _ = release.wait(5)
+
+    thread = threading.Thread(target=hold_context)
+    thread.start()
+    _ = entered.wait(5)
+    with cached_dns_lookups():
+        pass
+    assert socket.getaddrinfo is not resolver
+
+    release.set()
+    thread.join()
+    assert socket.getaddrinfo is resolver
+
+
+# =============================================================================
+# DEADLINE TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize("stage", [True, False])
+def test_deadline_mid_body_leaves_no_partial_file(tmp_path: Path, stage: bool):
+    """A body still streaming at the deadline is abandoned and deleted."""
+    chunk = b"x" * noaa_grib_fetcher._DOWNLOAD_CHUNK_BYTES  # pyright: ignore[reportPrivateUsage]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=iter([chunk] * 4))
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    output_path = tmp_path / "run.grib"
+    target = output_path if stage else part_path_for(output_path)
+
+    bytes_written, attempt = fetch_with_retry(
+        client, URL, target, deadline=time.monotonic(), stage=stage
+    )
+
+    assert bytes_written is None
+    assert attempt.error_type == "deadline"
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,50 @@
+"""
+Tests for --hours parsing.
+
+Hour 0 is the analysis file, which is always fetched, so it is dropped.
+"""
+
+import pytest
+import typer
+
+from fetch_forecast import parse_forecast_hours
+
+# =============================================================================
+# PARSING TESTS
+# =============================================================================
+
+
+def test_parse_forecast_hours_keeps_order():
+    """Hours come back in the order given, with blanks and spaces ignored."""
+    assert parse_forecast_hours("6,12,24") == (6, 12, 24)
+    assert parse_forecast_hours(" 24, 6 ,,12,") == (24, 6, 12)
+
+
+def test_parse_forecast_hours_drops_duplicates_and_analysis():
+    """Repeated hours collapse to the first one and hour 0 is removed."""
+    assert parse_forecast_hours("12,6,12,0,6") == (12, 6)
+    assert parse_forecast_hours("0") == ()
+
+
+def test_parse_forecast_hours_accepts_full_range():
+    """A long list of hours such as a whole forecast range parses intact."""
+    value = ",".join(str(hour) for hour in range(0, 121, 3))
+    assert parse_forecast_hours(value) == tuple(range(3, 121, 3))
+
+
+# =============================================================================
+# INVALID INPUT TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize("value", ["6,twelve", "6-12", "1.5", "6;12"])
+def test_parse_forecast_hours_rejects_non_integers(value: str):
+    """Tokens that are not plain integers raise BadParameter."""
+    with pytest.raises(typer.BadParameter):
+        parse_forecast_hours(value)
+
+
+def test_parse_forecast_hours_rejects_negative():
+    """Negative hours raise BadParameter."""
+    with pytest.raises(typer.BadParameter):
+        parse_forecast_hours("6,-3")
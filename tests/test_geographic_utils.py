@@ -11,7 +11,6 @@ from noaa_query_builder import (
     normalize_longitude,
 )
 
-
 # =============================================================================
 # LATITUDE TESTS
 # =============================================================================
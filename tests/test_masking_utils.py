@@ -0,0 +1,50 @@
+"""
+Tests for hexadecimal mask utilities.
+
+Masks map the first key to the most significant bit.
+"""
+
+from noaa_query_builder import (
+    build_new_mask,
+    get_binary_mask_from_hex,
+    get_url_encoded_keys,
+    reveal_masked_values,
+)
+
+KEYS = ["TMP", "UGRD", "VGRD", "PRES", "RH"]
+
+
+# =============================================================================
+# DECODING TESTS
+# =============================================================================
+
+
+def test_get_binary_mask_from_hex_pads_to_length():
+    """Leading zero bits are kept up to the mask length."""
+    assert get_binary_mask_from_hex("0x3", 4) == (0, 0, 1, 1)
+    assert get_binary_mask_from_hex("0xF", 4) == (1, 1, 1, 1)
+
+
+def test_reveal_masked_values_first_key_is_high_bit():
+    """Bit order runs from the most significant bit to the least."""
+    assert reveal_masked_values(KEYS, "0x1a") == ["TMP", "UGRD", "PRES"]
+    assert reveal_masked_values(KEYS, "0x1") == ["RH"]
+    assert reveal_masked_values(KEYS, "0x0") == []
+
+
+def test_get_url_encoded_keys_adds_prefix():
+    """Selected keys are encoded as prefix+key=on pairs."""
+    assert get_url_encoded_keys(KEYS, "0x18", "var_") == "var_TMP=on&var_UGRD=on"
+
+
+# =============================================================================
+# ROUND-TRIP TESTS
+# =============================================================================
+
+
+def test_build_new_mask_round_trips():
+    """Building a mask and revealing it returns the original selection."""
+    selected = ("TMP", "UGRD", "PRES")
+    mask = build_new_mask(KEYS, selected)
+    assert mask == "0x1a"
+    assert reveal_masked_values(KEYS, mask) == list(selected)
@@ -0,0 +1,124 @@
+"""
+Tests for forecast run selection.
+
+GFS runs every 6 hours and the default lookback covers the last four runs.
+"""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from noaa_query_builder import (
+    BoundingBox,
+    CoreSettings,
+    QueryModel,
+    QueryStructure,
+    QueryTime,
+    SelectedKeys,
+    build_qt,
+    generate_qt_batch,
+)
+
+KEYS = SelectedKeys(all_keys=["TMP"], hex_mask="0x1", prefix="var_")
+
+QS = QueryStructure(
+    bounding_box=BoundingBox(
+        toplat=50.0, leftlon=262.0, rightlon=272.0, bottomlat=40.0
+    ),
+    query_model=QueryModel(
+        name="gfs_quarter_degree",
+        filter="filter_gfs_0p25.pl",
+        file="gfs.t{cycle_hour_utc}z.pgrb2.0p25.anl",
+        dir="/gfs.{date_utc}/{cycle_hour_utc}/atmos",
+    ),
+    variables=KEYS,
+    levels=KEYS,
+    current_time=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    settings=CoreSettings(
+        grib_url="https://nomads.ncep.noaa.gov/cgi-bin/{filter}",
+        output_dir=Path("/tmp"),
+        forecast_interval_hours=6,
+        max_lookback_hours=18,
+    ),
+)
+
+
+def runs(*pairs: tuple[str, str]) -> tuple[QueryTime, ...]:
+    """QueryTimes from (date_utc, cycle_hour_utc) pairs."""
+    return tuple(QueryTime(date_utc=d, cycle_hour_utc=h) for d, h in pairs)
+
+
+def legacy_batch(reference_time: datetime) -> tuple[QueryTime, ...]:
+    """Run sequence as the original build_qt-per-offset loop produced it."""
+    cropped = reference_time.replace(minute=0, second=0, microsecond=0)
+    latest_run_start = cropped.replace(hour=cropped.hour // 6 * 6)
+    if latest_run_start + timedelta(hours=3) <= reference_time:
+        latest_cycle = cropped.replace(hour=latest_run_start.hour)
+    else:
+        latest_cycle = cropped.replace(
+            hour=(latest_run_start - timedelta(hours=6)).hour
+        )
+    return tuple(
+        build_qt(dt_object=latest_cycle - timedelta(hours=offset), qs=QS)
+        for offset in range(0, 19, 6)
+    )
+
+
+# =============================================================================
+# RUN SEQUENCE TESTS
+# =============================================================================
+
+
+def test_generate_qt_batch_crosses_day_boundary():
+    """Fallback runs step back past midnight into the previous day."""
+    reference = datetime(2025, 1, 1, 9, 30, tzinfo=timezone.utc)
+    assert generate_qt_batch(reference, QS) == runs(
+        ("20250101", "06"),
+        ("20250101", "00"),
+        ("20241231", "18"),
+        ("20241231", "12"),
+    )
+
+
+def test_generate_qt_batch_skips_run_under_three_hours_old():
+    """A run that started less than 3 hours ago is not tried yet."""
+    just_before = datetime(2025, 1, 1, 8, 59, tzinfo=timezone.utc)
+    on_cutoff = datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc)
+    assert generate_qt_batch(just_before, QS)[0] == QueryTime("20250101", "00")
+    assert generate_qt_batch(on_cutoff, QS)[0] == QueryTime("20250101", "06")
+
+
+def test_generate_qt_batch_skipped_midnight_run_falls_back_a_day():
+    """Shortly after 00Z the newest candidate is the previous day's 18Z."""
+    reference = datetime(2025, 1, 1, 1, 17, tzinfo=timezone.utc)
+    assert generate_qt_batch(reference, QS) == runs(
+        ("20241231", "18"),
+        ("20241231", "12"),
+        ("20241231", "06"),
+        ("20241231", "00"),
+    )
+
+
+@pytest.mark.parametrize("hour", range(3, 24))
+def test_generate_qt_batch_matches_build_qt(hour: int):
+    """From 03Z on, the sequence matches the original build_qt loop."""
+    reference = datetime(2025, 1, 1, hour, 17, tzinfo=timezone.utc)
+    assert generate_qt_batch(reference, QS) == legacy_batch(reference)
+
+
+def test_generate_qt_batch_steps_back_by_model_interval():
+    """A skipped run falls back by forecast_interval_hours, not a fixed 6."""
+    qs = QS.model_copy(
+        update={
+            "settings": QS.settings.model_copy(
+                update={"forecast_interval_hours": 3, "max_lookback_hours": 6}
+            )
+        }
+    )
+    reference = datetime(2025, 1, 1, 1, 17, tzinfo=timezone.utc)
+    assert generate_qt_batch(reference, qs) == runs(
+        ("20241231", "21"),
+        ("20241231", "18"),
+        ("20241231", "15"),
+    )